@@ -4,16 +4,102 @@ Handles connections to Ethereum blockchain and data extraction
 """
 
 import logging
+import operator
+import random
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from web3 import Web3
+from web3.datastructures import AttributeDict
 from web3.exceptions import BlockNotFound, TransactionNotFound
-import time
-from typing import Dict, List, Optional, Any
-from config import INFURA_URL
+from web3.providers.rpc import HTTPProvider
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from web3._utils.rpc_abi import RPC
+from web3._utils.request import DEFAULT_TIMEOUT
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+import pyarrow as pa
+import pyarrow.compute as pc
+from cache import LRUCache, TTLCache
+from rate_limiter import TokenBucket
+from config import INFURA_URL, RPC_BATCH_SIZE, RPC_MAX_WORKERS, RPC_RATE_LIMIT
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Retry settings for HTTP 429 (rate limited) responses from the provider
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 0.5  # Seconds, doubled on every retry and randomized by up to +/-50%
+
+# Keep-alive connections kept open to the provider
+HTTP_POOL_SIZE = 32
+
+# Number of formatted blocks / transactions kept in memory by get_block and get_transaction
+BLOCK_CACHE_SIZE = 1024
+TX_CACHE_SIZE = 65536
+
+# Seconds the latest block number is reused before asking the provider again
+LATEST_BLOCK_TTL = 5
+
+# Wei per unit, for converting amounts to ether / gwei
+WEI_PER_ETHER = 10 ** 18
+WEI_PER_GWEI = 10 ** 9
+
+# Raw transaction fields read by _format_transactions, in unpacking order
+_get_tx_fields = operator.itemgetter(
+    'hash', 'blockNumber', 'from', 'to', 'value', 'gas', 'gasPrice', 'input', 'nonce', 'transactionIndex'
+)
+
+# Arrow type for wei amounts in columnar exports (38 digits is ~1e20 ETH, far above total supply)
+WEI_ARROW_TYPE = pa.decimal128(38, 0)
+
+
+class SessionHTTPProvider(HTTPProvider):
+    """
+    HTTP provider that sends every request through one shared requests session
+    
+    web3 6.x caches the session given to HTTPProvider per thread, so calls from worker
+    threads would otherwise fall back to a new unpooled session without retries.
+    """
+    
+    def __init__(self, endpoint_uri: str, session: requests.Session, request_kwargs: Optional[Any] = None):
+        """
+        Initialize the provider
+        
+        Args:
+            endpoint_uri: URL of the Ethereum provider
+            session: Session used for every request, from any thread
+            request_kwargs: Extra keyword arguments for each POST (headers, timeout, ...)
+        """
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self.session = session
+    
+    def post(self, **kwargs) -> requests.Response:
+        """
+        POST to the provider through the shared session
+        
+        Uses web3's default timeout unless request_kwargs sets one.
+        
+        Args:
+            **kwargs: Request body arguments (data or json)
+            
+        Returns:
+            The successful HTTP response
+        """
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        response = self.session.post(self.endpoint_uri, **request_kwargs, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    def make_request(self, method, params):
+        """Send a single JSON-RPC call and decode the response"""
+        request_data = self.encode_rpc_request(method, params)
+        return self.decode_rpc_response(self.post(data=request_data).content)
+
 
 class BlockchainClient:
     """
@@ -35,12 +121,28 @@ class BlockchainClient:
             raise ValueError("No valid Infura URL found. Please set INFURA_URL in your environment variables with your Infura Project ID.")
         
         self.w3 = None
+        self.session = None
+        self._block_cache = LRUCache(maxsize=BLOCK_CACHE_SIZE)
+        self._tx_cache = LRUCache(maxsize=TX_CACHE_SIZE)
+        self._latest_block_cache = TTLCache(ttl=LATEST_BLOCK_TTL)
+        # Shared by all threads so concurrent requests stay within the provider quota together
+        self._rate_limiter = TokenBucket(rate=RPC_RATE_LIMIT)
         self._connect()
     
     def _connect(self):
         """Establish connection to Ethereum network"""
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.provider_url))
+            # Share one pooled keep-alive HTTP session between Web3 calls and batched requests
+            # on every thread, so each RPC call reuses an open connection instead of a new TLS handshake
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(total=3, backoff_factor=0.2)
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.w3 = Web3(SessionHTTPProvider(self.provider_url, self.session))
             if self.w3.is_connected():
                 logger.info(f"Successfully connected to Ethereum network via {self.provider_url}")
                 logger.info(f"Current block number: {self.w3.eth.block_number}")
@@ -51,9 +153,20 @@ class BlockchainClient:
             raise
     
     def get_latest_block_number(self) -> int:
-        """Get the latest block number"""
+        """
+        Get the latest block number
+        
+        The value is cached for LATEST_BLOCK_TTL seconds; new blocks only
+        arrive every ~12 seconds, so repeated calls skip the RPC round trip.
+        """
+        latest_block_number = self._latest_block_cache.get('latest')
+        if latest_block_number is not None:
+            return latest_block_number
+        
         try:
-            return self.w3.eth.block_number
+            latest_block_number = self._call_with_backoff(lambda: self.w3.eth.block_number)
+            self._latest_block_cache.set('latest', latest_block_number)
+            return latest_block_number
         except Exception as e:
             logger.error(f"Error getting latest block number: {e}")
             raise
@@ -69,24 +182,25 @@ class BlockchainClient:
         Returns:
             Block data dictionary or None if not found
         """
+        # Serve repeated requests for the same block from memory ('latest' etc. are never cached)
+        cache_key = (block_number, include_transactions) if isinstance(block_number, int) else None
+        if cache_key is not None:
+            cached_block = self._block_cache.get(cache_key)
+            if cached_block is not None:
+                return self._copy_block(cached_block)
+        
         try:
-            block = self.w3.eth.get_block(block_number, full_transactions=include_transactions)
-            
-            # DEBUG: Log transaction retrieval details
-            if include_transactions:
-                tx_count = len(block.get('transactions', []))
-                logger.info(f"DEBUG: Block {block_number} retrieved with {tx_count} transactions")
-                if tx_count > 0:
-                    first_tx = block['transactions'][0]
-                    # Treat Web3 AttributeDict like a mapping
-                    if hasattr(first_tx, 'get'):
-                        logger.info(f"DEBUG: First transaction is full object with hash: {first_tx.get('hash', 'N/A')}")
-                    else:
-                        logger.warning(f"DEBUG: First transaction is just a hash: {first_tx}")
-                else:
-                    logger.info(f"DEBUG: Block {block_number} contains no transactions")
-            
-            return self._format_block_data(block)
+            block = self._call_with_backoff(self.w3.eth.get_block, block_number, full_transactions=include_transactions)
+            
+            # Log transaction retrieval details (skipped entirely unless debug logging is on)
+            if include_transactions and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Block %s retrieved with %s transactions", block_number, len(block['transactions']))
+            
+            block_data = self._format_block_data(block, full_transactions=include_transactions)
+            if cache_key is not None:
+                self._block_cache.set(cache_key, block_data)
+                return self._copy_block(block_data)
+            return block_data
         except BlockNotFound:
             logger.warning(f"Block {block_number} not found")
             return None
@@ -98,6 +212,9 @@ class BlockchainClient:
         """
         Get multiple blocks in a range
         
+        Blocks are requested in JSON-RPC batches of RPC_BATCH_SIZE, so a range
+        costs one HTTP round trip per batch instead of one per block.
+        
         Args:
             start_block: Starting block number
             end_block: Ending block number
@@ -105,13 +222,155 @@ class BlockchainClient:
         Returns:
             List of block data dictionaries
         """
-        blocks = []
-        for block_num in range(start_block, end_block + 1):
-            block_data = self.get_block(block_num)
-            if block_data:
-                blocks.append(block_data)
-            time.sleep(0.1)  # Rate limiting to avoid API limits
-        return blocks
+        return [self._format_block_data(block) for block in self._get_raw_block_range(start_block, end_block)]
+    
+    def get_block_range_tables(self, start_block: int, end_block: int) -> Tuple[pa.Table, pa.Table]:
+        """
+        Get multiple blocks in a range as columnar Arrow tables
+        
+        Intended for bulk export and loading: the blocks are fetched like
+        get_block_range, but formatted column by column instead of into one
+        dictionary per block and transaction.
+        
+        Args:
+            start_block: Starting block number
+            end_block: Ending block number
+            
+        Returns:
+            Tuple of (blocks table, transactions table)
+        """
+        return self._format_block_batch(list(self._get_raw_block_range(start_block, end_block)))
+    
+    def _get_raw_block_range(self, start_block: int, end_block: int) -> Iterator[Any]:
+        """
+        Fetch raw Web3 blocks with full transactions in JSON-RPC batches of RPC_BATCH_SIZE
+        
+        Args:
+            start_block: Starting block number
+            end_block: Ending block number
+            
+        Yields:
+            Raw blocks in block number order (missing blocks are skipped)
+        """
+        block_numbers = list(range(start_block, end_block + 1))
+        
+        for i in range(0, len(block_numbers), RPC_BATCH_SIZE):
+            batch = block_numbers[i:i + RPC_BATCH_SIZE]
+            try:
+                # Providers bill every call in a batch, so it costs one token per block
+                raw_blocks = self._call_with_backoff(self._get_blocks_batch, batch, cost=len(batch))
+            except Exception as e:
+                # Some providers reject batch arrays - fall back to concurrent single requests
+                logger.warning(f"Batch request for blocks {batch[0]}-{batch[-1]} failed, fetching individually: {e}")
+                raw_blocks = self._get_blocks_concurrently(batch)
+            
+            for block_num, block in zip(batch, raw_blocks):
+                if block is None:
+                    logger.warning(f"Block {block_num} not found")
+                    continue
+                yield block
+    
+    def _get_blocks_batch(self, block_numbers: List[int]) -> List[Optional[Any]]:
+        """
+        Fetch several blocks with full transactions in a single JSON-RPC batch request
+        
+        Args:
+            block_numbers: Block numbers to retrieve
+            
+        Returns:
+            Raw blocks in the same order as block_numbers (None for missing blocks)
+            
+        Raises:
+            ValueError: If the provider returned an error (or nothing) for any of the blocks
+        """
+        if hasattr(self.w3, 'batch_requests'):
+            # web3.py v7+ builds, sends and decodes the batch natively
+            with self.w3.batch_requests() as batch:
+                for block_num in block_numbers:
+                    batch.add(self.w3.eth.get_block(block_num, True))
+                return list(batch.execute())
+
+        # web3.py 6.x has no batching API, so post the JSON-RPC batch array directly
+        payload = [
+            {'jsonrpc': '2.0', 'method': 'eth_getBlockByNumber', 'params': [hex(block_num), True], 'id': block_num}
+            for block_num in block_numbers
+        ]
+        results = self.w3.provider.post(json=payload).json()
+        
+        if not isinstance(results, list):
+            raise ValueError(f"Provider returned a non-batch response: {results}")
+        
+        # Apply the same result formatters Web3 uses for eth.get_block
+        block_formatter = PYTHONIC_RESULT_FORMATTERS[RPC.eth_getBlockByNumber]
+        results_by_id = {result.get('id'): result for result in results}
+        
+        # Providers report per-call failures (e.g. rate limits or quota errors) as error
+        # elements inside a successful response; raise instead of treating the blocks as
+        # missing, so the caller refetches them with single requests and backoff
+        failed = {
+            block_num: results_by_id.get(block_num, {}).get('error', 'no response')
+            for block_num in block_numbers
+            if 'result' not in results_by_id.get(block_num, {})
+        }
+        if failed:
+            first_block = min(failed)
+            raise ValueError(f"Batch request failed for {len(failed)} of {len(block_numbers)} blocks "
+                             f"(block {first_block}: {failed[first_block]})")
+        
+        raw_blocks = []
+        for block_num in block_numbers:
+            block = results_by_id[block_num]['result']
+            raw_blocks.append(AttributeDict.recursive(block_formatter(block)) if block else None)
+        return raw_blocks
+    
+    def _get_blocks_concurrently(self, block_numbers: List[int]) -> List[Optional[Any]]:
+        """
+        Fetch raw blocks with full transactions with one request each, spread over a thread pool
+        
+        The work is network-bound, so threads overlap the round trips.
+        
+        Args:
+            block_numbers: Block numbers to retrieve
+            
+        Returns:
+            Raw blocks in the same order as block_numbers (None for missing or failed blocks)
+        """
+        def fetch(block_num):
+            try:
+                return self._call_with_backoff(self.w3.eth.get_block, block_num, full_transactions=True)
+            except BlockNotFound:
+                return None
+            except Exception as e:
+                logger.error(f"Error getting block {block_num}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(RPC_MAX_WORKERS, len(block_numbers))) as executor:
+            return list(executor.map(fetch, block_numbers))
+    
+    def _call_with_backoff(self, func, *args, cost: int = 1, **kwargs):
+        """
+        Call a Web3 method within the rate limit, retrying with exponential backoff when rate limited
+        
+        Args:
+            func: Web3 method to call
+            *args, **kwargs: Arguments passed to func
+            cost: Number of RPC calls func makes (tokens taken from the rate limiter)
+            
+        Returns:
+            The result of func
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._rate_limiter.acquire(cost)
+            try:
+                return func(*args, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                rate_limited = e.response is not None and e.response.status_code == 429
+                if not rate_limited or attempt == RATE_LIMIT_RETRIES:
+                    raise
+                # Jitter keeps concurrent workers from retrying in lockstep
+                delay = RATE_LIMIT_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"Rate limited by provider, retrying in {delay:.1f}s")
+                time.sleep(delay)
     
     def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """
@@ -123,30 +382,132 @@ class BlockchainClient:
         Returns:
             Transaction data dictionary or None if not found
         """
+        cached_tx = self._tx_cache.get(tx_hash)
+        if cached_tx is not None:
+            return dict(cached_tx)
+        
         try:
-            tx = self.w3.eth.get_transaction(tx_hash)
-            return self._format_transaction_data(tx)
+            tx = self._call_with_backoff(self.w3.eth.get_transaction, tx_hash)
+            tx_data = self._format_transaction_data(tx)
+            self._tx_cache.set(tx_hash, tx_data)
+            return dict(tx_data)
         except TransactionNotFound:
             logger.warning(f"Transaction {tx_hash} not found")
             return None
         except Exception as e:
             logger.error(f"Error getting transaction {tx_hash}: {e}")
             return None
+
+    def get_transactions_with_receipts(self, tx_hashes: List[str]) -> Dict[str, Tuple[Optional[Any], Optional[Any]]]:
+        """
+        Get raw transactions and their receipts, two RPC calls per hash sent in JSON-RPC batches
+
+        Args:
+            tx_hashes: Transaction hashes
+
+        Returns:
+            Dictionary mapping each hash to a (transaction, receipt) tuple of Web3 results
+            (None for a transaction or receipt the provider does not have)
+        """
+        results = {}
+        # Two calls per hash, so half as many hashes as blocks fit in one batch
+        batch_size = max(RPC_BATCH_SIZE // 2, 1)
+
+        try:
+            for i in range(0, len(tx_hashes), batch_size):
+                batch = tx_hashes[i:i + batch_size]
+                results.update(
+                    self._call_with_backoff(self._get_transactions_with_receipts_batch, batch, cost=2 * len(batch))
+                )
+        except Exception as e:
+            logger.error(f"Error getting transactions with receipts: {e}")
+
+        return results
+
+    def _get_transactions_with_receipts_batch(self, tx_hashes: List[str]) -> Dict[str, Tuple[Optional[Any], Optional[Any]]]:
+        """
+        Fetch transactions and their receipts in a single JSON-RPC batch request
+
+        Args:
+            tx_hashes: Transaction hashes to retrieve
+
+        Returns:
+            Dictionary mapping each hash to a (transaction, receipt) tuple (None for missing results)
+        """
+        if hasattr(self.w3, 'batch_requests'):
+            # web3.py v7+ builds, sends and decodes the batch natively
+            with self.w3.batch_requests() as batch:
+                for tx_hash in tx_hashes:
+                    batch.add(self.w3.eth.get_transaction(tx_hash))
+                    batch.add(self.w3.eth.get_transaction_receipt(tx_hash))
+                responses = list(batch.execute())
+            return {
+                tx_hash: (responses[2 * i], responses[2 * i + 1])
+                for i, tx_hash in enumerate(tx_hashes)
+            }
+
+        # web3.py 6.x has no batching API, so post the JSON-RPC batch array directly
+        methods = (RPC.eth_getTransactionByHash, RPC.eth_getTransactionReceipt)
+        payload = [
+            {'jsonrpc': '2.0', 'method': method, 'params': [tx_hash], 'id': 2 * i + j}
+            for i, tx_hash in enumerate(tx_hashes)
+            for j, method in enumerate(methods)
+        ]
+        responses = self.w3.provider.post(json=payload).json()
+
+        if not isinstance(responses, list):
+            raise ValueError(f"Provider returned a non-batch response: {responses}")
+
+        # Apply the same result formatters Web3 uses for eth.get_transaction / eth.get_transaction_receipt
+        responses_by_id = {result.get('id'): result for result in responses}
+
+        results = {}
+        for i, tx_hash in enumerate(tx_hashes):
+            pair = []
+            for j, method in enumerate(methods):
+                result = responses_by_id.get(2 * i + j, {})
+                if 'error' in result:
+                    logger.error(f"Error calling {method} for {tx_hash}: {result['error']}")
+                value = result.get('result')
+                pair.append(
+                    AttributeDict.recursive(PYTHONIC_RESULT_FORMATTERS[method](value)) if value else None
+                )
+            results[tx_hash] = tuple(pair)
+        return results
+
+    @staticmethod
+    def _copy_block(block_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a cached block so callers can modify it without touching the cache
+        
+        Args:
+            block_data: Formatted block data
+            
+        Returns:
+            Copy of the block with its own transaction dictionaries
+        """
+        block_copy = dict(block_data)
+        block_copy['transactions'] = [dict(tx) for tx in block_data['transactions']]
+        return block_copy
     
-    def _format_block_data(self, block) -> Dict[str, Any]:
+    def _format_block_data(self, block, full_transactions: bool = True) -> Dict[str, Any]:
         """
         Format raw block data into a structured dictionary
         
         Args:
             block: Raw block data from Web3
+            full_transactions: Whether the block was fetched with full transaction
+                objects (otherwise it only holds hashes, which are not included)
             
         Returns:
             Formatted block data
         """
+        # bytes.hex is the C implementation; HexBytes.hex wraps it in Python to add the
+        # 0x prefix (and drops the prefix entirely in hexbytes 1.x), so prefix explicitly
         formatted_block = {
             'block_number': block['number'],
-            'block_hash': block['hash'].hex(),
-            'parent_hash': block['parentHash'].hex(),
+            'block_hash': '0x' + bytes.hex(block['hash']),
+            'parent_hash': '0x' + bytes.hex(block['parentHash']),
             'timestamp': block['timestamp'],
             'miner': block['miner'],
             'difficulty': block['difficulty'],
@@ -156,11 +517,7 @@ class BlockchainClient:
         }
         
         # Only format transactions if they are full transaction objects (not just hashes)
-        if block['transactions'] and len(block['transactions']) > 0 and hasattr(block['transactions'][0], 'get'):
-            formatted_block['transactions'] = [self._format_transaction_data(tx) for tx in block['transactions']]
-        else:
-            # If transactions are just hashes or empty, don't include them
-            formatted_block['transactions'] = []
+        formatted_block['transactions'] = self._format_transactions(block['transactions']) if full_transactions else []
             
         return formatted_block
     
@@ -174,20 +531,95 @@ class BlockchainClient:
         Returns:
             Formatted transaction data
         """
-        return {
-            'tx_hash': tx['hash'].hex(),
-            'block_number': tx['blockNumber'],
-            'from_address': tx['from'],
-            'to_address': tx['to'],
-            'value_wei': tx['value'],
-            'value_ether': self.w3.from_wei(tx['value'], 'ether'),
-            'gas': tx['gas'],
-            'gas_price': tx['gasPrice'],
-            'gas_price_gwei': self.w3.from_wei(tx['gasPrice'], 'gwei'),
-            'input_data': tx['input'],
-            'nonce': tx['nonce'],
-            'transaction_index': tx['transactionIndex']
-        }
+        return self._format_transactions([tx])[0]
+    
+    @staticmethod
+    def _format_transactions(transactions) -> List[Dict[str, Any]]:
+        """
+        Format a list of raw transactions into structured dictionaries
+        
+        Ether and gwei amounts are plain floats (the exact wei integers are kept
+        alongside), so they load into pandas as float64 instead of object columns.
+        
+        Args:
+            transactions: Raw transaction data from Web3
+            
+        Returns:
+            List of formatted transaction data
+        """
+        # AttributeDict.__getitem__ is a Python method, so read all fields with one
+        # C-level itemgetter call on the underlying dict (plain dicts are used as-is)
+        fields = map(_get_tx_fields, [getattr(tx, '__dict__', tx) for tx in transactions])
+        
+        # Hashes and input data are hex encoded the same way as in _format_block_data, so
+        # both databases store input data as '0x...' text; int / int division rounds
+        # correctly even for amounts beyond float precision
+        return [{
+            'tx_hash': '0x' + bytes.hex(tx_hash),
+            'block_number': block_number,
+            'from_address': from_address,
+            'to_address': to_address,
+            'value_wei': value,
+            'value_ether': value / WEI_PER_ETHER,
+            'gas': gas,
+            'gas_price': gas_price,
+            'gas_price_gwei': gas_price / WEI_PER_GWEI,
+            'input_data': '0x' + bytes.hex(input_data),
+            'nonce': nonce,
+            'transaction_index': transaction_index
+        } for tx_hash, block_number, from_address, to_address, value, gas, gas_price, input_data, nonce, transaction_index
+            in fields]
+    
+    @staticmethod
+    def _format_block_batch(blocks: List[Any]) -> Tuple[pa.Table, pa.Table]:
+        """
+        Format raw blocks into columnar Arrow tables
+        
+        Each field becomes one typed array (wei amounts as exact decimals,
+        hashes and input data as 0x hex strings), so no per-row dictionaries are created.
+        The columns match the keys produced by _format_block_data and
+        _format_transaction_data.
+        
+        Args:
+            blocks: Raw blocks with full transactions from Web3
+            
+        Returns:
+            Tuple of (blocks table, transactions table)
+        """
+        blocks_table = pa.table({
+            'block_number': pa.array([block['number'] for block in blocks], pa.int64()),
+            'block_hash': pa.array(['0x' + bytes.hex(block['hash']) for block in blocks], pa.string()),
+            'parent_hash': pa.array(['0x' + bytes.hex(block['parentHash']) for block in blocks], pa.string()),
+            'timestamp': pa.array([block['timestamp'] for block in blocks], pa.int64()),
+            'miner': pa.array([block['miner'] for block in blocks], pa.string()),
+            'difficulty': pa.array([block['difficulty'] for block in blocks], pa.int64()),
+            'gas_limit': pa.array([block['gasLimit'] for block in blocks], pa.int64()),
+            'gas_used': pa.array([block['gasUsed'] for block in blocks], pa.int64()),
+            'transaction_count': pa.array([len(block['transactions']) for block in blocks], pa.int32()),
+        })
+        
+        txs = [tx for block in blocks for tx in block['transactions']]
+        
+        # Wei amounts can exceed 64 bits, so keep them as exact decimals
+        value_wei = pa.array([Decimal(tx['value']) for tx in txs], WEI_ARROW_TYPE)
+        gas_price = pa.array([Decimal(tx['gasPrice']) for tx in txs], WEI_ARROW_TYPE)
+        
+        transactions_table = pa.table({
+            'tx_hash': pa.array(['0x' + bytes.hex(tx['hash']) for tx in txs], pa.string()),
+            'block_number': pa.array([tx['blockNumber'] for tx in txs], pa.int64()),
+            'from_address': pa.array([tx['from'] for tx in txs], pa.string()),
+            'to_address': pa.array([tx['to'] for tx in txs], pa.string()),
+            'value_wei': value_wei,
+            'value_ether': pc.divide(pc.cast(value_wei, pa.float64()), float(WEI_PER_ETHER)),
+            'gas': pa.array([tx['gas'] for tx in txs], pa.int64()),
+            'gas_price': gas_price,
+            'gas_price_gwei': pc.divide(pc.cast(gas_price, pa.float64()), float(WEI_PER_GWEI)),
+            'input_data': pa.array(['0x' + bytes.hex(tx['input']) for tx in txs], pa.string()),
+            'nonce': pa.array([tx['nonce'] for tx in txs], pa.int64()),
+            'transaction_index': pa.array([tx['transactionIndex'] for tx in txs], pa.int32()),
+        })
+        
+        return blocks_table, transactions_table
     
     def get_eth_balance(self, address: str) -> float:
         """
@@ -0,0 +1,107 @@
+"""
+Cache Module
+Small thread-safe in-memory caches shared by the blockchain client and database layer
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """
+    Size-bounded least-recently-used cache
+
+    Once maxsize entries are stored, adding a new entry evicts the entry that
+    was used least recently. All operations are guarded by a lock so the cache
+    can be shared between worker threads.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key (marking it as recently used) or default"""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry if the cache is full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return the cached value for key, or default if absent"""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache:
+    """
+    Cache whose entries expire a fixed number of seconds after being stored
+
+    Useful for values that change on a known schedule, such as the chain head
+    which only advances every ~12 seconds.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if absent or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value that expires after ttl seconds"""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return the cached value for key, or default if absent"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
@@ -15,14 +15,24 @@ POSTGRES_PORT = os.getenv('POSTGRES_PORT', '5432')
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'postgres')  # Use default database first
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'password')
+POSTGRES_POOL_SIZE = int(os.getenv('POSTGRES_POOL_SIZE', '10'))  # Connections kept open in the pool
+POSTGRES_MAX_OVERFLOW = int(os.getenv('POSTGRES_MAX_OVERFLOW', '20'))  # Extra connections allowed under load
+POSTGRES_SYNCHRONOUS_COMMIT = os.getenv('POSTGRES_SYNCHRONOUS_COMMIT', 'off')  # 'off' skips the WAL fsync wait on commit
 
 MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
 MONGODB_DB = os.getenv('MONGODB_DB', 'blockchain_data')
+MONGODB_JOURNAL_WRITES = os.getenv('MONGODB_JOURNAL_WRITES', 'false').lower() == 'true'  # 'false' skips the journal flush wait on writes
 
 # Data Collection Configuration
 BATCH_SIZE = int(os.getenv('BATCH_SIZE', '100'))  # Number of blocks to process in one batch
 START_BLOCK = int(os.getenv('START_BLOCK', '0'))  # Starting block number
 END_BLOCK = int(os.getenv('END_BLOCK', '0'))      # 0 means latest block
+RPC_BATCH_SIZE = int(os.getenv('RPC_BATCH_SIZE', '20'))  # Number of blocks requested in one JSON-RPC batch
+RPC_MAX_WORKERS = int(os.getenv('RPC_MAX_WORKERS', '16'))  # Concurrent requests when batching is unavailable
+RPC_RATE_LIMIT = float(os.getenv('RPC_RATE_LIMIT', '25'))  # Max RPC calls per second (0 = unlimited)
+ETL_MAX_WORKERS = int(os.getenv('ETL_MAX_WORKERS', '4'))  # Historical batches processed concurrently
+DB_WRITE_BATCH_BLOCKS = int(os.getenv('DB_WRITE_BATCH_BLOCKS', '50'))  # Blocks stored per database write
+DB_WRITE_BATCH_SECONDS = float(os.getenv('DB_WRITE_BATCH_SECONDS', '5'))  # Max seconds a block waits to be written
 
 # Logging Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -4,12 +4,20 @@ Streamlit Dashboard for Blockchain Data Visualization
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from database import DatabaseManager
 from blockchain_client import BlockchainClient
+from web3.exceptions import TransactionNotFound
+from eth_utils import keccak
 import logging
 
 # Configure logging
@@ -35,6 +43,219 @@ def get_blockchain_client():
     """Get blockchain client instance"""
     return BlockchainClient()
 
+@st.cache_resource
+def get_etl_pipeline():
+    """Get ETL pipeline instance, kept open so each collection reuses its connections"""
+    # Imported here so the pipeline's log file is only set up once collection is used
+    from etl_pipeline import ETLPipeline
+    return ETLPipeline(use_postgres=True, use_mongodb=False)
+
+# Data loaders - cached for about one block time and keyed on the newest stored
+# block, so reruns reuse the query results until new data has been collected
+DATA_CACHE_TTL = 12
+
+def get_data_version(db_manager):
+    """Return the newest block number in the database, used as the data loaders' cache key"""
+    latest_db_block = db_manager.get_latest_block_from_db()
+    return latest_db_block['block_number'] if latest_db_block else None
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_recent_blocks_frame(fields, limit, data_version):
+    """Load the given columns of the most recent blocks, with timestamps as datetimes"""
+    df_blocks = get_db_manager().get_recent_blocks_frame(list(fields), limit=limit)
+    if 'timestamp' in df_blocks:
+        # Converted once per cache entry; second resolution matches the stored Unix
+        # timestamps, so this is a reinterpretation of the integers, not a rescale
+        df_blocks['timestamp'] = df_blocks['timestamp'].astype('datetime64[s]')
+    return df_blocks
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_recent_transactions_frame(fields, limit, data_version):
+    """Load the given columns of the most recent transactions"""
+    return get_db_manager().get_recent_transactions_frame(list(fields), limit=limit)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_recent_token_transfer_counts(limit, data_version):
+    """Load the number of transactions and likely token transfers among the most recent transactions"""
+    return get_db_manager().count_recent_token_transfers(limit)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_recent_token_transfers(limit, data_version):
+    """Load the most recent likely token transfers"""
+    return get_db_manager().get_recent_token_transfers(limit)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_recent_contract_activity_counts(limit, data_version):
+    """Load the number of transactions, contract calls and contract creations among the most recent transactions"""
+    return get_db_manager().count_recent_contract_activity(limit)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_top_function_signatures(limit_rows, top_n, data_version):
+    """Load the most called function signatures among the most recent transactions"""
+    return get_db_manager().get_top_function_signatures(limit_rows, top_n)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_daily_transaction_counts(data_version):
+    """Load the transaction count per day"""
+    return get_db_manager().get_daily_transaction_counts()
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_block_time_histogram(bins, data_version):
+    """Load the binned block time distribution"""
+    return get_db_manager().get_block_time_histogram(bins=bins)
+
+@st.cache_data(ttl=DATA_CACHE_TTL)
+def load_gas_statistics(data_version):
+    """Load the gas usage summary statistics"""
+    return get_db_manager().get_gas_statistics()
+
+# Most points sent to the browser for one chart series
+MAX_CHART_POINTS = 2000
+
+def downsample_for_chart(df, y, max_points=MAX_CHART_POINTS):
+    """
+    Reduce a time series to at most max_points rows for plotting
+    
+    The rows are split into max_points / 2 equal buckets and only the rows with
+    the lowest and highest y value of each bucket are kept, so spikes and dips
+    stay visible while Plotly serializes and renders far fewer points.
+    """
+    if len(df) <= max_points:
+        return df
+    
+    values = df[y].to_numpy(dtype='float64', na_value=np.nan)
+    edges = np.linspace(0, len(values), max_points // 2 + 1, dtype=int)
+    keep = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        bucket = values[start:end]
+        keep.extend((start + bucket.argmin(), start + bucket.argmax()))
+    return df.iloc[np.unique(keep)]
+
+def downcast_table_columns(df, columns):
+    """
+    Store integer table columns in the smallest unsigned type that holds their values
+    
+    st.dataframe sends the whole table to the browser as Arrow on every rerun,
+    so e.g. transaction counts travel as 2-byte instead of 8-byte integers.
+    Columns with negative values keep their type.
+    """
+    return df.assign(**{
+        column: pd.to_numeric(df[column], downcast='unsigned')
+        for column in columns
+        if pd.api.types.is_integer_dtype(df[column])
+    })
+
+# Chart builders - cached so reruns with unchanged data reuse the built figure.
+# Each figure sets a fixed uirevision so the browser keeps the user's zoom and
+# pan state when the chart is redrawn, and line charts render with WebGL.
+@st.cache_data(ttl=30)
+def build_gas_usage_fig(df_blocks):
+    """Build the gas usage over time line chart"""
+    fig_gas = px.line(
+        downsample_for_chart(df_blocks, 'gas_used'), 
+        x='timestamp', 
+        y='gas_used',
+        title="Gas Usage Over Time",
+        labels={'gas_used': 'Gas Used', 'timestamp': 'Time'},
+        render_mode='webgl'
+    )
+    fig_gas.update_layout(uirevision='gas_usage')
+    return fig_gas
+
+@st.cache_data(ttl=30)
+def build_tx_count_fig(df_blocks):
+    """Build the transaction count per block bar chart"""
+    fig_tx_count = px.bar(
+        downsample_for_chart(df_blocks, 'transaction_count'),
+        x='timestamp',
+        y='transaction_count',
+        title="Transaction Count per Block",
+        labels={'transaction_count': 'Transactions', 'timestamp': 'Time'}
+    )
+    fig_tx_count.update_layout(uirevision='tx_count')
+    return fig_tx_count
+
+def histogram_bar(values, bins=50, value_range=None):
+    """
+    Bin values with numpy and return the histogram as a bar trace
+    
+    Only the bin counts are sent to the browser, instead of every value for
+    Plotly to bin client-side.
+    """
+    counts, edges = np.histogram(values.dropna().to_numpy(dtype='float64'), bins=bins, range=value_range)
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))
+
+@st.cache_data(ttl=30)
+def build_value_distribution_fig(df_txs):
+    """Build the transaction value histogram, clipped at the 95th percentile"""
+    fig_value = go.Figure(histogram_bar(
+        df_txs['value_ether'], bins=50, value_range=(0, df_txs['value_ether'].quantile(0.95))
+    ))
+    fig_value.update_layout(
+        title="Transaction Value Distribution (ETH)",
+        xaxis_title="Value (ETH)",
+        yaxis_title="Count",
+        bargap=0,
+        uirevision='value_distribution'
+    )
+    return fig_value
+
+@st.cache_data(ttl=30)
+def build_gas_price_distribution_fig(df_txs):
+    """Build the gas price histogram"""
+    fig_gas_price = go.Figure(histogram_bar(df_txs['gas_price_gwei'], bins=50))
+    fig_gas_price.update_layout(
+        title="Gas Price Distribution (Gwei)",
+        xaxis_title="Gas Price (Gwei)",
+        yaxis_title="Count",
+        bargap=0,
+        uirevision='gas_price_distribution'
+    )
+    return fig_gas_price
+
+@st.cache_data(ttl=30)
+def build_tx_types_fig(df_txs):
+    """Build the transaction types pie chart"""
+    tx_type_counts = categorize_transactions(df_txs).value_counts()
+    fig_tx_types = px.pie(
+        values=tx_type_counts.values,
+        names=tx_type_counts.index,
+        title="Transaction Types Distribution"
+    )
+    fig_tx_types.update_layout(uirevision='tx_types')
+    return fig_tx_types
+
+@st.cache_data(ttl=30)
+def build_daily_tx_fig(daily_txs):
+    """Build the daily transaction count line chart"""
+    fig_daily = px.line(
+        pd.DataFrame(daily_txs),
+        x='date',
+        y='transaction_count',
+        title="Daily Transaction Count",
+        labels={'transaction_count': 'Transactions', 'date': 'Date'},
+        render_mode='webgl'
+    )
+    fig_daily.update_layout(uirevision='daily_tx')
+    return fig_daily
+
+@st.cache_data(ttl=30)
+def build_block_time_fig(block_time_bins):
+    """Build the block time histogram from pre-binned counts"""
+    fig_block_time = go.Figure(go.Bar(
+        x=[(b['bin_start'] + b['bin_end']) / 2 for b in block_time_bins],
+        y=[b['count'] for b in block_time_bins],
+        width=[b['bin_end'] - b['bin_start'] for b in block_time_bins]
+    ))
+    fig_block_time.update_layout(
+        title="Block Time Distribution (seconds)",
+        xaxis_title="Block Time (seconds)",
+        yaxis_title="Count",
+        bargap=0,
+        uirevision='block_time'
+    )
+    return fig_block_time
+
 def main():
     """Main dashboard function"""
     
@@ -79,7 +300,15 @@ def show_overview(db_manager, blockchain_client):
     
     # Get latest blockchain info
     try:
-        latest_block_num = blockchain_client.get_latest_block_number()
+        # The RPC call and the database queries are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            latest_block_future = executor.submit(blockchain_client.get_latest_block_number)
+            # Estimated counts: exact COUNT(*) scans the whole table on large databases
+            total_blocks_future = executor.submit(db_manager.get_total_blocks_count, estimate=True)
+            total_transactions_future = executor.submit(db_manager.get_total_transactions_count, estimate=True)
+            latest_db_block_future = executor.submit(db_manager.get_latest_block_from_db)
+        
+        latest_block_num = latest_block_future.result()
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
@@ -87,17 +316,17 @@ def show_overview(db_manager, blockchain_client):
         
         with col2:
             # Get total blocks in database
-            total_blocks = db_manager.get_total_blocks_count()
+            total_blocks = total_blocks_future.result()
             st.metric("Blocks Collected", f"{total_blocks:,}")
         
         with col3:
             # Get total transactions in database
-            total_transactions = db_manager.get_total_transactions_count()
+            total_transactions = total_transactions_future.result()
             st.metric("Transactions Collected", f"{total_transactions:,}")
         
         with col4:
             # Get latest block from database
-            latest_db_block = db_manager.get_latest_block_from_db()
+            latest_db_block = latest_db_block_future.result()
             if latest_db_block:
                 st.metric("Last Updated", f"Block #{latest_db_block['block_number']:,}")
             else:
@@ -110,31 +339,17 @@ def show_overview(db_manager, blockchain_client):
     st.subheader("Recent Blocks")
     try:
         # Get last 50 blocks
-        recent_blocks = db_manager.get_recent_blocks(50)
+        df_blocks = load_recent_blocks_frame(
+            ('block_number', 'timestamp', 'gas_used', 'gas_limit', 'transaction_count'), 50,
+            get_data_version(db_manager)
+        )
         
-        if recent_blocks:
-            df_blocks = pd.DataFrame(recent_blocks)
-            df_blocks['timestamp'] = pd.to_datetime(df_blocks['timestamp'], unit='s')
-            
+        if not df_blocks.empty:
             # Gas usage over time
-            fig_gas = px.line(
-                df_blocks, 
-                x='timestamp', 
-                y='gas_used',
-                title="Gas Usage Over Time",
-                labels={'gas_used': 'Gas Used', 'timestamp': 'Time'}
-            )
-            st.plotly_chart(fig_gas, use_container_width=True)
+            st.plotly_chart(build_gas_usage_fig(df_blocks), use_container_width=True)
             
             # Transaction count over time
-            fig_tx = px.bar(
-                df_blocks,
-                x='timestamp',
-                y='transaction_count',
-                title="Transaction Count per Block",
-                labels={'transaction_count': 'Transactions', 'timestamp': 'Time'}
-            )
-            st.plotly_chart(fig_tx, use_container_width=True)
+            st.plotly_chart(build_tx_count_fig(df_blocks), use_container_width=True)
         else:
             st.info("No block data available. Start data collection first.")
     
@@ -145,34 +360,40 @@ def show_block_explorer(db_manager, blockchain_client):
     """Show block explorer"""
     st.header("🔍 Block Explorer")
     
-    # Debug section
-    with st.expander("🔧 Debug Information"):
-        st.write("**Database Status:**")
+    # Debug section - only queried and rendered when requested
+    show_debug = st.checkbox("🔧 Show debug information")
+    if show_debug:
         try:
+            dbg = ["Database Status:"]
             total_blocks = db_manager.get_total_blocks_count()
             total_transactions = db_manager.get_total_transactions_count()
-            st.write(f"- Total blocks in database: {total_blocks}")
-            st.write(f"- Total transactions in database: {total_transactions}")
+            dbg.append(f"- Total blocks in database: {total_blocks}")
+            dbg.append(f"- Total transactions in database: {total_transactions}")
             
+            missing_transactions = False
             if total_blocks > 0:
                 latest_block = db_manager.get_latest_block_from_db()
                 if latest_block:
-                    st.write(f"- Latest block: #{latest_block['block_number']}")
+                    dbg.append(f"- Latest block: #{latest_block['block_number']}")
                     
                     # Test getting this block with transactions
                     test_block = db_manager.get_block(latest_block['block_number'], include_transactions=True)
                     if test_block and 'transactions' in test_block:
-                        st.write(f"- Latest block has {len(test_block['transactions'])} transactions stored")
+                        dbg.append(f"- Latest block has {len(test_block['transactions'])} transactions stored")
                         # Show first few transaction hashes as proof
                         if test_block['transactions']:
-                            st.write(f"- Sample transaction hashes:")
+                            dbg.append("- Sample transaction hashes:")
                             for i, tx in enumerate(test_block['transactions'][:3]):
-                                st.write(f"  • TX {i+1}: {tx['tx_hash'][:20]}...")
+                                dbg.append(f"  • TX {i+1}: {tx['tx_hash'][:20]}...")
                     else:
-                        st.write(f"- Latest block has no transaction data stored")
-                        st.warning("⚠️ This indicates transactions weren't collected with the block data")
+                        dbg.append("- Latest block has no transaction data stored")
+                        missing_transactions = True
             else:
-                st.write("- No blocks found. Please collect some data first.")
+                dbg.append("- No blocks found. Please collect some data first.")
+            
+            st.code("\n".join(dbg), language='text')
+            if missing_transactions:
+                st.warning("⚠️ This indicates transactions weren't collected with the block data")
                 
         except Exception as e:
             st.error(f"Error getting debug info: {e}")
@@ -212,21 +433,32 @@ def show_block_explorer(db_manager, blockchain_client):
                     st.info("💡 Tip: Make sure you've collected this block first!")
             
             elif search_option == "Latest Blocks":
-                # Get blocks with transactions included
-                blocks = db_manager.get_recent_blocks(num_blocks, include_transactions=True)
-                
-                if blocks:
-                    st.success(f"Found {len(blocks)} blocks in database")
-                    display_blocks_table(blocks)
-                else:
-                    st.info("No blocks found in database")
-                    st.write("💡 **Try collecting some data first:**")
-                    st.write("1. Go to 'Data Collection' page")
-                    st.write("2. Select 'Latest Blocks' and collect 5-10 blocks")
-                    st.write("3. Come back here to view the blocks with transaction hashes")
+                # Transactions are loaded for all blocks at once by display_blocks_table.
+                # The result is kept in the session so the table stays on screen when its
+                # own widgets trigger a rerun.
+                st.session_state['explorer_blocks'] = db_manager.get_recent_blocks(
+                    num_blocks, include_transactions=False
+                )
         
         except Exception as e:
             st.error(f"Error searching blocks: {e}")
+    
+    # Latest blocks stay displayed until the next search
+    if search_option == "Latest Blocks" and 'explorer_blocks' in st.session_state:
+        try:
+            blocks = st.session_state['explorer_blocks']
+            if blocks:
+                st.success(f"Found {len(blocks)} blocks in database")
+                display_blocks_table(blocks, db_manager, show_debug=show_debug)
+            else:
+                st.info("No blocks found in database")
+                st.write("💡 **Try collecting some data first:**")
+                st.write("1. Go to 'Data Collection' page")
+                st.write("2. Select 'Latest Blocks' and collect 5-10 blocks")
+                st.write("3. Come back here to view the blocks with transaction hashes")
+        
+        except Exception as e:
+            st.error(f"Error displaying blocks: {e}")
 
 def display_block_details(block_data):
     """Display detailed block information"""
@@ -253,51 +485,58 @@ def display_block_details(block_data):
         st.subheader("Transactions")
         display_transactions_table(block_data['transactions'])
 
-def display_blocks_table(blocks):
+def display_blocks_table(blocks, db_manager, show_debug=False):
     """Display blocks in a table with transaction hashes"""
-    # First, get full block data with transactions for all blocks
-    db_manager = get_db_manager()
-    enriched_blocks = []
-    
-    # Debug information
-    st.write("🔍 **Debug Information:**")
+    # Load every block's transactions in one batched query instead of one query per block.
+    # Blocks without transactions have nothing to load, so they are left out of the query.
+    by_num = db_manager.get_blocks_with_transactions(
+        [block['block_number'] for block in blocks if block.get('transaction_count', 0)]
+    )
+    enriched_blocks = [by_num.get(block['block_number'], block) for block in blocks]
     
-    for block in blocks:
-        try:
-            # Get full block data with transactions
-            full_block_data = db_manager.get_block(block['block_number'], include_transactions=True)
-            
-            # Debug output
-            st.write(f"Block #{block['block_number']}:")
-            st.write(f"- Original block has {block.get('transaction_count', 0)} transactions")
-            
-            if full_block_data:
-                st.write(f"- Retrieved block data: ✅")
-                if 'transactions' in full_block_data and full_block_data['transactions']:
-                    st.write(f"- Transactions in retrieved data: {len(full_block_data['transactions'])}")
-                    # Show sample transaction hashes
-                    sample_tx = full_block_data['transactions'][0]
-                    st.write(f"- Sample TX hash: {sample_tx['tx_hash'][:20]}...")
-                else:
-                    st.write(f"- No transactions found in retrieved data")
-                    st.warning("⚠️ Block was collected without transaction data")
-                enriched_blocks.append(full_block_data)
+    if show_debug:
+        # Rendered as a single element rather than one per line
+        dbg = []
+        for block in blocks:
+            full_block_data = by_num.get(block['block_number'])
+            if not block.get('transaction_count', 0):
+                dbg.append(f"Block #{block['block_number']}: no transactions in block")
+            elif full_block_data:
+                dbg.append(
+                    f"Block #{block['block_number']}: {len(full_block_data['transactions'])} of "
+                    f"{block.get('transaction_count', 0)} transactions retrieved"
+                )
             else:
-                st.write(f"- Failed to retrieve full block data ❌")
-                enriched_blocks.append(block)  # Fallback to original block data
-                
-        except Exception as e:
-            st.error(f"Error enriching block {block['block_number']}: {e}")
-            enriched_blocks.append(block)  # Fallback to original block data
+                dbg.append(f"Block #{block['block_number']}: failed to retrieve full block data")
+        st.code("\n".join(dbg), language='text')
     
     # Create the main blocks table
     df = pd.DataFrame(blocks)
     df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
     df = df[['block_number', 'block_hash', 'timestamp', 'transaction_count', 'gas_used']]
     df.columns = ['Block #', 'Block Hash', 'Timestamp', 'Tx Count', 'Gas Used']
+    df = downcast_table_columns(df, ['Block #', 'Tx Count', 'Gas Used'])
     
     st.dataframe(df, use_container_width=True)
     
+    # A single selector for every listed transaction instead of Analyze buttons per transaction
+    tx_labels = {
+        tx['tx_hash']: f"Block #{block_data['block_number']} · {tx['tx_hash'][:18]}..."
+        for block_data in enriched_blocks
+        for tx in block_data.get('transactions') or []
+    }
+    if tx_labels:
+        st.subheader("🔍 Quick Analysis")
+        selected_tx_hash = st.selectbox(
+            "Select a transaction to analyze:",
+            list(tx_labels),
+            format_func=tx_labels.get,
+            key="explorer_analyze_tx"
+        )
+        if st.button("Analyze", key="explorer_analyze_button"):
+            st.session_state['selected_tx_hash'] = selected_tx_hash
+            st.success("✅ Transaction selected! Go to Transaction Analysis tab.")
+    
     # Show transaction hashes for each block
     st.subheader("📋 Transaction Hashes by Block")
     
@@ -317,33 +556,25 @@ def display_blocks_table(blocks):
                         'Transaction Hash': tx['tx_hash'],
                         'From': tx['from_address'][:10] + '...' if tx['from_address'] else 'N/A',
                         'To': tx['to_address'][:10] + '...' if tx['to_address'] else 'Contract Creation',
-                        'Value (ETH)': f"{float(tx['value_ether']):.6f}" if tx['value_ether'] else '0',
-                        'Gas Price (Gwei)': f"{float(tx['gas_price_gwei']):.2f}" if tx['gas_price_gwei'] else '0'
+                        'Value (ETH)': float(tx['value_ether'] or 0),
+                        'Gas Price (Gwei)': float(tx['gas_price_gwei'] or 0)
                     })
                 
-                # Display transaction table
-                tx_df = pd.DataFrame(tx_data)
-                st.dataframe(tx_df, use_container_width=True)
-                
-                # Add analyze buttons for first few transactions
-                st.write("**Quick Analysis:**")
-                cols = st.columns(min(5, len(transactions)))
-                for i, tx in enumerate(transactions[:5]):
-                    with cols[i]:
-                        if st.button(f"Analyze TX #{i+1}", key=f"analyze_block_{block_num}_tx_{i}"):
-                            st.session_state['selected_tx_hash'] = tx['tx_hash']
-                            st.success("✅ Transaction selected! Go to Transaction Analysis tab.")
+                # Display transaction table - amounts stay numeric and are formatted by the browser
+                tx_df = downcast_table_columns(pd.DataFrame(tx_data), ['Index'])
+                st.dataframe(
+                    tx_df,
+                    use_container_width=True,
+                    column_config={
+                        'Value (ETH)': st.column_config.NumberColumn(format="%.6f"),
+                        'Gas Price (Gwei)': st.column_config.NumberColumn(format="%.2f")
+                    }
+                )
                 
                 # Show copyable transaction hashes
                 st.write("**Copy Transaction Hashes:**")
-                for i, tx in enumerate(transactions[:10]):  # Show first 10
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        st.code(tx['tx_hash'], language='text')
-                    with col2:
-                        if st.button(f"Analyze", key=f"analyze_copy_{block_num}_{i}"):
-                            st.session_state['selected_tx_hash'] = tx['tx_hash']
-                            st.success("✅ Hash selected! Go to Transaction Analysis.")
+                for tx in transactions[:10]:  # Show first 10
+                    st.code(tx['tx_hash'], language='text')
         else:
             with st.expander(f"Block #{block_num} - No transaction data available"):
                 st.warning("⚠️ Transaction data not found for this block.")
@@ -355,27 +586,12 @@ def display_blocks_table(blocks):
                 # Add a button to check if transactions exist separately
                 if st.button(f"Check for transactions in Block #{block_num}", key=f"check_tx_{block_num}"):
                     try:
-                        if db_manager.use_postgres:
-                            session = db_manager.PostgresSession()
-                            from database import Transaction
-                            tx_count = session.query(Transaction).filter(
-                                Transaction.block_number == block_num
-                            ).count()
-                            session.close()
-                            if tx_count > 0:
-                                st.success(f"Found {tx_count} transactions in database for this block!")
-                                st.info("The issue is with data retrieval, not storage.")
-                            else:
-                                st.warning("No transactions found in database for this block.")
-                        elif db_manager.use_mongodb:
-                            tx_count = db_manager.transactions_collection.count_documents(
-                                {'block_number': block_num}
-                            )
-                            if tx_count > 0:
-                                st.success(f"Found {tx_count} transactions in database for this block!")
-                                st.info("The issue is with data retrieval, not storage.")
-                            else:
-                                st.warning("No transactions found in database for this block.")
+                        tx_count = db_manager.count_transactions_in_block(block_num)
+                        if tx_count > 0:
+                            st.success(f"Found {tx_count} transactions in database for this block!")
+                            st.info("The issue is with data retrieval, not storage.")
+                        else:
+                            st.warning("No transactions found in database for this block.")
                     except Exception as e:
                         st.error(f"Error checking transactions: {e}")
 
@@ -416,49 +632,28 @@ def show_transaction_analysis(db_manager):
     
     try:
         # Get recent transactions
-        recent_txs = db_manager.get_recent_transactions(1000)
+        # Only the charted columns and those used by categorize_transactions
+        df_txs = load_recent_transactions_frame(
+            ('value_ether', 'gas_price_gwei', 'input_data', 'to_address'), 1000,
+            get_data_version(db_manager)
+        )
         
-        if recent_txs:
-            df_txs = pd.DataFrame(recent_txs)
-            
+        if not df_txs.empty:
             col1, col2 = st.columns(2)
             
             with col1:
                 # Value distribution
-                fig_value = px.histogram(
-                    df_txs,
-                    x='value_ether',
-                    nbins=50,
-                    title="Transaction Value Distribution (ETH)",
-                    labels={'value_ether': 'Value (ETH)', 'count': 'Count'}
-                )
-                fig_value.update_xaxes(range=[0, df_txs['value_ether'].quantile(0.95)])
-                st.plotly_chart(fig_value, use_container_width=True)
+                st.plotly_chart(build_value_distribution_fig(df_txs), use_container_width=True)
             
             with col2:
                 # Gas price distribution
-                fig_gas = px.histogram(
-                    df_txs,
-                    x='gas_price_gwei',
-                    nbins=50,
-                    title="Gas Price Distribution (Gwei)",
-                    labels={'gas_price_gwei': 'Gas Price (Gwei)', 'count': 'Count'}
-                )
-                st.plotly_chart(fig_gas, use_container_width=True)
+                st.plotly_chart(build_gas_price_distribution_fig(df_txs), use_container_width=True)
             
             # Transaction types analysis
             st.subheader("🔍 Transaction Types Analysis")
             
             # Categorize transactions
-            df_txs['tx_type'] = df_txs.apply(categorize_transaction, axis=1)
-            tx_type_counts = df_txs['tx_type'].value_counts()
-            
-            fig_types = px.pie(
-                values=tx_type_counts.values,
-                names=tx_type_counts.index,
-                title="Transaction Types Distribution"
-            )
-            st.plotly_chart(fig_types, use_container_width=True)
+            st.plotly_chart(build_tx_types_fig(df_txs), use_container_width=True)
         
         else:
             st.info("No transaction data available. Start data collection first!")
@@ -528,57 +723,34 @@ def show_network_statistics(db_manager):
     st.header("🌐 Network Statistics")
     
     try:
-        # Get all blocks
-        all_blocks = db_manager.get_all_blocks()
+        # Aggregations run in the database so only summary rows are loaded
+        data_version = get_data_version(db_manager)
+        daily_txs = load_daily_transaction_counts(data_version)
         
-        if all_blocks:
-            df_blocks = pd.DataFrame(all_blocks)
-            df_blocks['timestamp'] = pd.to_datetime(df_blocks['timestamp'], unit='s')
-            
+        if daily_txs:
             # Network activity over time
             st.subheader("Network Activity")
             
             # Daily transaction count
-            df_blocks['date'] = df_blocks['timestamp'].dt.date
-            daily_txs = df_blocks.groupby('date')['transaction_count'].sum().reset_index()
-            
-            fig_daily = px.line(
-                daily_txs,
-                x='date',
-                y='transaction_count',
-                title="Daily Transaction Count",
-                labels={'transaction_count': 'Transactions', 'date': 'Date'}
-            )
-            st.plotly_chart(fig_daily, use_container_width=True)
+            st.plotly_chart(build_daily_tx_fig(daily_txs), use_container_width=True)
             
             # Block time analysis
-            df_blocks = df_blocks.sort_values('timestamp')
-            df_blocks['block_time'] = df_blocks['timestamp'].diff().dt.total_seconds()
-            
-            fig_block_time = px.histogram(
-                df_blocks.dropna(),
-                x='block_time',
-                nbins=50,
-                title="Block Time Distribution (seconds)",
-                labels={'block_time': 'Block Time (seconds)', 'count': 'Count'}
-            )
-            st.plotly_chart(fig_block_time, use_container_width=True)
+            block_time_bins = load_block_time_histogram(50, data_version)
+            st.plotly_chart(build_block_time_fig(block_time_bins), use_container_width=True)
             
             # Gas usage statistics
             st.subheader("Gas Usage Statistics")
+            gas_stats = load_gas_statistics(data_version) or {}
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                avg_gas = df_blocks['gas_used'].mean()
-                st.metric("Average Gas Used", f"{avg_gas:,.0f}")
+                st.metric("Average Gas Used", f"{gas_stats.get('avg_gas_used', 0):,.0f}")
             
             with col2:
-                max_gas = df_blocks['gas_used'].max()
-                st.metric("Maximum Gas Used", f"{max_gas:,.0f}")
+                st.metric("Maximum Gas Used", f"{gas_stats.get('max_gas_used', 0):,.0f}")
             
             with col3:
-                avg_gas_limit = df_blocks['gas_limit'].mean()
-                st.metric("Average Gas Limit", f"{avg_gas_limit:,.0f}")
+                st.metric("Average Gas Limit", f"{gas_stats.get('avg_gas_limit', 0):,.0f}")
         
         else:
             st.info("No network data available")
@@ -620,29 +792,26 @@ def show_token_transfers_page(db_manager, blockchain_client):
     elif search_type == "Recent Activity":
         st.subheader("📊 Recent Token Transfer Activity")
         
-        # Get recent transactions and analyze for token transfers
+        # Token transfers are counted and selected by the database
         try:
-            recent_txs = db_manager.get_recent_transactions(100)
-            if recent_txs:
-                token_tx_count = 0
-                for tx in recent_txs:
-                    if tx.get('input_data') and tx['input_data'] != '0x':
-                        if (tx['input_data'].startswith('0xa9059cbb') or 
-                            tx['input_data'].startswith('0x23b872dd')):
-                            token_tx_count += 1
+            data_version = get_data_version(db_manager)
+            transfer_counts = load_recent_token_transfer_counts(100, data_version)
+            if transfer_counts['transaction_count']:
+                recent_tx_count = transfer_counts['transaction_count']
+                token_tx_count = transfer_counts['token_transfer_count']
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Recent Transactions", len(recent_txs))
+                    st.metric("Recent Transactions", recent_tx_count)
                 with col2:
                     st.metric("Likely Token Transfers", token_tx_count)
                 with col3:
-                    percentage = (token_tx_count / len(recent_txs)) * 100 if recent_txs else 0
+                    percentage = (token_tx_count / recent_tx_count) * 100
                     st.metric("Token Transfer %", f"{percentage:.1f}%")
                 
                 # Show sample token transfers
                 st.subheader("Sample Token Transfer Transactions")
-                token_txs = [tx for tx in recent_txs if tx.get('input_data', '').startswith(('0xa9059cbb', '0x23b872dd'))][:10]
+                token_txs = load_recent_token_transfers(10, data_version)
                 
                 if token_txs:
                     for tx in token_txs:
@@ -699,70 +868,72 @@ def show_smart_contracts_page(db_manager, blockchain_client):
         st.subheader("📊 Recent Smart Contract Activity")
         
         try:
-            recent_txs = db_manager.get_recent_transactions(100)
-            if recent_txs:
-                contract_tx_count = 0
-                contract_creation_count = 0
-                
-                for tx in recent_txs:
-                    if tx.get('input_data') and tx['input_data'] != '0x':
-                        if tx.get('to_address'):
-                            contract_tx_count += 1
-                        else:
-                            contract_creation_count += 1
+            data_version = get_data_version(db_manager)
+            # Counts and the signature histogram are aggregated by the database
+            counts = load_recent_contract_activity_counts(100, data_version)
+            if counts['transaction_count']:
+                contract_tx_count = counts['contract_call_count']
                 
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("Recent Transactions", len(recent_txs))
+                    st.metric("Recent Transactions", counts['transaction_count'])
                 with col2:
                     st.metric("Contract Calls", contract_tx_count)
                 with col3:
-                    st.metric("Contract Creations", contract_creation_count)
+                    st.metric("Contract Creations", counts['contract_creation_count'])
                 with col4:
-                    percentage = (contract_tx_count / len(recent_txs)) * 100 if recent_txs else 0
+                    percentage = (contract_tx_count / counts['transaction_count']) * 100
                     st.metric("Contract Call %", f"{percentage:.1f}%")
                 
                 # Function signature analysis
                 st.subheader("🔍 Popular Function Signatures")
-                function_sigs = {}
-                for tx in recent_txs:
-                    if tx.get('input_data') and len(tx['input_data']) >= 10:
-                        sig = tx['input_data'][:10]
-                        function_sigs[sig] = function_sigs.get(sig, 0) + 1
-                
-                if function_sigs:
-                    # Sort by frequency
-                    sorted_sigs = sorted(function_sigs.items(), key=lambda x: x[1], reverse=True)[:10]
-                    
-                    for sig, count in sorted_sigs:
-                        function_name = get_function_name_from_signature(sig)
-                        col1, col2, col3 = st.columns([2, 2, 1])
-                        with col1:
-                            st.code(sig)
-                        with col2:
-                            st.write(function_name or "Unknown Function")
-                        with col3:
-                            st.write(f"{count} calls")
+                top_sigs = load_top_function_signatures(100, 10, data_version)
+                if top_sigs:
+                    # One Arrow table instead of three widgets per signature
+                    st.dataframe(pa.table({
+                        'Signature': [sig for sig, _ in top_sigs],
+                        'Function': [get_function_name_from_signature(sig) or "Unknown Function" for sig, _ in top_sigs],
+                        'Calls': pa.array([count for _, count in top_sigs], pa.int64()),
+                    }), use_container_width=True, hide_index=True)
                 
                 # Show sample contract interactions
                 st.subheader("Sample Contract Interactions")
-                contract_txs = [tx for tx in recent_txs if tx.get('input_data', '') != '0x' and tx.get('to_address')][:10]
+                df_txs = load_recent_transactions_frame(('tx_hash', 'to_address', 'input_data'), 100, data_version)
+                tbl = pa.Table.from_pandas(df_txs, schema=pa.schema([
+                    ('tx_hash', pa.string()), ('to_address', pa.string()), ('input_data', pa.string())
+                ]), preserve_index=False)
+                input_col = tbl['input_data']
+                has_input = pc.and_(pc.is_valid(input_col), pc.invert(pc.is_in(input_col, value_set=pa.array(['', '0x']))))
+                has_to = pc.fill_null(pc.not_equal(tbl['to_address'], ''), False)
+                contract_txs = tbl.filter(pc.and_(has_input, has_to)).slice(0, 10)
                 
-                if contract_txs:
-                    for tx in contract_txs:
-                        with st.expander(f"Contract Call: {tx['tx_hash'][:20]}..."):
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.write(f"**Hash:** `{tx['tx_hash']}`")
-                                st.write(f"**Contract:** `{tx['to_address']}`")
-                            with col2:
-                                st.write(f"**Function:** `{tx['input_data'][:10]}`")
-                                function_name = get_function_name_from_signature(tx['input_data'][:10])
-                                if function_name:
-                                    st.write(f"**Likely Function:** {function_name}")
-                            
-                            if st.button(f"Analyze", key=f"contract_analyze_{tx['tx_hash'][:10]}"):
-                                show_smart_contract_analysis_for_transaction(tx['tx_hash'], db_manager)
+                if contract_txs.num_rows:
+                    # Fetch every receipt up front so the analysis renders from session state
+                    tx_hashes = contract_txs['tx_hash'].to_pylist()
+                    prefetch_transactions_with_receipts(tx_hashes)
+                    
+                    # One table and a single selector instead of an expander and Analyze button per call
+                    signatures = pc.utf8_slice_codeunits(contract_txs['input_data'], 0, 10).to_pylist()
+                    function_names = [get_function_name_from_signature(sig) for sig in signatures]
+                    st.dataframe(pa.table({
+                        'Transaction Hash': contract_txs['tx_hash'],
+                        'Contract': contract_txs['to_address'],
+                        'Function': signatures,
+                        'Likely Function': function_names,
+                    }), use_container_width=True, hide_index=True)
+                    
+                    tx_labels = {
+                        tx_hash: f"{tx_hash[:20]}... · {function_name or sig}"
+                        for tx_hash, sig, function_name in zip(tx_hashes, signatures, function_names)
+                    }
+                    selected_tx_hash = st.selectbox(
+                        "Select a contract call to analyze:",
+                        tx_hashes,
+                        format_func=tx_labels.get,
+                        key="contract_analyze_tx"
+                    )
+                    if st.button("Analyze", key="contract_analyze_button"):
+                        show_smart_contract_analysis_for_transaction(selected_tx_hash, db_manager)
                 else:
                     st.info("No recent contract interactions found")
             else:
@@ -797,9 +968,7 @@ def show_data_collection(db_manager, blockchain_client):
     # Run collection
     if st.button("Start Collection"):
         try:
-            from etl_pipeline import ETLPipeline
-            
-            pipeline = ETLPipeline(use_postgres=True, use_mongodb=False)
+            pipeline = get_etl_pipeline()
             
             with st.spinner("Collecting data..."):
                 if collection_type == "Latest Blocks":
@@ -813,35 +982,128 @@ def show_data_collection(db_manager, blockchain_client):
             st.success(f"Collection completed!")
             st.json(stats)
             
-            pipeline.close()
-            
         except Exception as e:
             st.error(f"Error during collection: {e}")
 
 def categorize_transaction(tx_data):
     """Categorize transaction based on input data and other properties"""
-    if not tx_data.get('input_data') or tx_data['input_data'] == '0x':
+    # Only the function selector ('0x' + 8 hex chars) of the input data matters
+    selector = (tx_data.get('input_data') or '')[:10]
+    return categorize_selector(selector, not tx_data.get('to_address'))
+
+# Transaction category for each recognized function selector
+CATEGORY_BY_SIGNATURE = {
+    '0xa9059cbb': "ERC-20 Transfer",
+    '0x23b872dd': "ERC-20 TransferFrom",
+    '0x095ea7b3': "ERC-20 Approve",
+    '0x42842e0e': "NFT Transfer",
+    '0x7ff36ab5': "Uniswap Swap",
+    '0x38ed1739': "Uniswap Swap (ETH)",
+}
+
+def categorize_selector(selector, is_contract_create):
+    """Categorize a transaction from its function selector and whether it creates a contract"""
+    if not selector or selector == '0x':
         return "ETH Transfer"
-    
-    input_data = tx_data['input_data']
-    
-    # Check for common function signatures
-    if input_data.startswith('0xa9059cbb'):
-        return "ERC-20 Transfer"
-    elif input_data.startswith('0x23b872dd'):
-        return "ERC-20 TransferFrom"
-    elif input_data.startswith('0x095ea7b3'):
-        return "ERC-20 Approve"
-    elif input_data.startswith('0x42842e0e') or input_data.startswith('0x23b872dd'):
-        return "NFT Transfer"
-    elif input_data.startswith('0x7ff36ab5'):
-        return "Uniswap Swap"
-    elif input_data.startswith('0x38ed1739'):
-        return "Uniswap Swap (ETH)"
-    elif not tx_data.get('to_address'):
+    if is_contract_create:
         return "Contract Creation"
-    else:
-        return "Smart Contract Call"
+    return CATEGORY_BY_SIGNATURE.get(selector, "Smart Contract Call")
+
+def categorize_transactions(df_txs):
+    """
+    Categorize every transaction in a DataFrame at once
+    
+    Vectorized equivalent of categorize_transaction() for the input_data and
+    to_address columns, returning one category per row.
+    """
+    input_data = df_txs['input_data'].fillna('0x').astype('string')
+    signature_category = input_data.str.slice(0, 10).map(CATEGORY_BY_SIGNATURE)
+    
+    # Same precedence as categorize_selector()
+    return pd.Series(np.select(
+        [
+            input_data.isin(['', '0x']).to_numpy(dtype=bool),
+            (df_txs['to_address'].fillna('') == '').to_numpy(dtype=bool),
+            signature_category.notna().to_numpy(dtype=bool),
+        ],
+        [
+            "ETH Transfer",
+            "Contract Creation",
+            signature_category.to_numpy(dtype=object),
+        ],
+        default="Smart Contract Call"
+    ), index=df_txs.index)
+
+# Seconds a fetched transaction and receipt are reused - confirmed transactions never change
+TX_RECEIPT_CACHE_TTL = 3600
+
+def to_plain_data(value):
+    """Recursively convert Web3 AttributeDicts to plain dicts and lists so Streamlit can cache them"""
+    if isinstance(value, Mapping):
+        return {key: to_plain_data(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain_data(item) for item in value]
+    return value
+
+@st.cache_data(ttl=TX_RECEIPT_CACHE_TTL, show_spinner=False)
+def _fetch_tx_and_receipt(tx_hash):
+    """
+    Fetch a transaction and its receipt in one batched RPC request, shared across reruns and sessions
+    
+    Raises TransactionNotFound (which Streamlit does not cache) for transactions
+    that are not confirmed yet, so they are looked up again on the next rerun.
+    """
+    tx, receipt = get_blockchain_client().get_transactions_with_receipts([tx_hash]).get(tx_hash, (None, None))
+    if tx is None or receipt is None:
+        raise TransactionNotFound(tx_hash)
+    return to_plain_data(tx), to_plain_data(receipt)
+
+def prefetch_transactions_with_receipts(tx_hashes):
+    """
+    Fetch transactions and receipts not yet seen this session in one batched RPC request
+    
+    Results are kept in st.session_state keyed by tx hash, so the analysis
+    panels render without another round trip. Unconfirmed transactions are
+    not kept, so they are looked up again on the next rerun.
+    """
+    fetched = st.session_state.setdefault('tx_receipts', {})
+    missing = [tx_hash for tx_hash in dict.fromkeys(tx_hashes) if tx_hash not in fetched]
+    if missing:
+        results = get_blockchain_client().get_transactions_with_receipts(missing)
+        fetched.update({
+            tx_hash: (to_plain_data(tx), to_plain_data(receipt)) for tx_hash, (tx, receipt) in results.items()
+            if tx is not None and receipt is not None
+        })
+
+def get_transaction_with_receipt(tx_hash):
+    """Get the (transaction, receipt) pair for a hash, raising TransactionNotFound if it is not on chain"""
+    prefetched = st.session_state.get('tx_receipts', {})
+    if tx_hash in prefetched:
+        return prefetched[tx_hash]
+    return _fetch_tx_and_receipt(tx_hash)
+
+# topic0 of the ERC-20/721 Transfer event: keccak256("Transfer(address,address,uint256)")
+TRANSFER_TOPIC0 = bytes.fromhex('ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef')
+
+def bloom_mask(value):
+    """
+    Get the 2048-bit logs bloom bits set for a log address or topic, as an integer mask
+    
+    Per the yellow paper, the low 11 bits of the first three byte pairs of
+    keccak256(value) each select one bit, counted from the low-order end.
+    """
+    digest = keccak(value)
+    # OR the bits together: two of the three indices can select the same bit
+    mask = 0
+    for i in (0, 2, 4):
+        mask |= 1 << (int.from_bytes(digest[i:i + 2], 'big') & 2047)
+    return mask
+
+TRANSFER_TOPIC0_BLOOM = bloom_mask(TRANSFER_TOPIC0)
+
+def bloom_may_contain(logs_bloom, mask):
+    """Check a receipt or block logsBloom for a bloom_mask() - False means the value is definitely absent"""
+    return int.from_bytes(logs_bloom, 'big') & mask == mask
 
 def show_token_transfers_for_transaction(tx_hash, db_manager):
     """Show token transfers for a specific transaction"""
@@ -850,43 +1112,40 @@ def show_token_transfers_for_transaction(tx_hash, db_manager):
     try:
         # Try to get token transfers from database (if implemented)
         # For now, we'll simulate this functionality
-        blockchain_client = get_blockchain_client()
         
         # Get transaction receipt to analyze logs
-        from web3.exceptions import TransactionNotFound
         try:
-            receipt = blockchain_client.w3.eth.get_transaction_receipt(tx_hash)
-            
-            token_transfers = []
-            transfer_event_signature = blockchain_client.w3.keccak(text="Transfer(address,address,uint256)").hex()
+            _, receipt = get_transaction_with_receipt(tx_hash)
+            logs = receipt['logs']
+            if not bloom_may_contain(receipt['logsBloom'], TRANSFER_TOPIC0_BLOOM):
+                # The bloom filter rules out any Transfer event without scanning the logs
+                logs = []
             
-            for log in receipt['logs']:
-                if len(log['topics']) >= 3 and log['topics'][0].hex() == transfer_event_signature:
-                    try:
-                        token_transfer = {
-                            'token_address': log['address'],
-                            'from_address': '0x' + log['topics'][1].hex()[-40:],
-                            'to_address': '0x' + log['topics'][2].hex()[-40:],
-                            'raw_amount': log['data'],
-                            'log_index': log['logIndex']
-                        }
-                        token_transfers.append(token_transfer)
-                    except Exception as e:
-                        continue
+            # Match topic0 with plain bytes compares; bytes.hex skips HexBytes' Python-level
+            # hex()/slicing overrides, which dominated the cost for log-heavy receipts
+            token_transfers = [
+                {
+                    'token_address': log['address'],
+                    'from_address': '0x' + bytes.hex(log['topics'][1])[-40:],
+                    'to_address': '0x' + bytes.hex(log['topics'][2])[-40:],
+                    'raw_amount': log['data'],
+                    'log_index': log['logIndex']
+                }
+                for log in logs
+                if len(log['topics']) >= 3 and log['topics'][0] == TRANSFER_TOPIC0
+            ]
             
             if token_transfers:
                 st.success(f"Found {len(token_transfers)} token transfer(s)")
                 
-                for i, transfer in enumerate(token_transfers):
-                    with st.expander(f"Token Transfer #{i+1}"):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write(f"**Token Contract:** `{transfer['token_address']}`")
-                            st.write(f"**From:** `{transfer['from_address']}`")
-                        with col2:
-                            st.write(f"**To:** `{transfer['to_address']}`")
-                            st.write(f"**Log Index:** {transfer['log_index']}")
-                        st.write(f"**Raw Amount Data:** `{transfer['raw_amount']}`")
+                # One Arrow table instead of an expander per transfer
+                st.dataframe(pa.table({
+                    'Token Contract': [transfer['token_address'] for transfer in token_transfers],
+                    'From': [transfer['from_address'] for transfer in token_transfers],
+                    'To': [transfer['to_address'] for transfer in token_transfers],
+                    'Log Index': [transfer['log_index'] for transfer in token_transfers],
+                    'Raw Amount Data': ['0x' + bytes.hex(transfer['raw_amount']) for transfer in token_transfers],
+                }), use_container_width=True, hide_index=True)
             else:
                 st.info("No token transfers found in this transaction")
                 
@@ -903,22 +1162,23 @@ def show_smart_contract_analysis_for_transaction(tx_hash, db_manager):
     st.subheader("🔧 Smart Contract Analysis")
     
     try:
-        blockchain_client = get_blockchain_client()
+        # Get transaction and receipt in one batched request
+        tx, receipt = get_transaction_with_receipt(tx_hash)
         
-        # Get transaction and receipt
-        tx = blockchain_client.w3.eth.get_transaction(tx_hash)
-        receipt = blockchain_client.w3.eth.get_transaction_receipt(tx_hash)
-        
-        if tx['to'] and tx['input'] and tx['input'] != '0x':
+        input_data = tx['input']
+        if tx['to'] and input_data and input_data != '0x':
             st.success("This is a smart contract interaction")
             
+            # Web3 returns the input as bytes - the selector is its first 4 bytes
+            function_sig = '0x' + bytes.hex(input_data[:4])
+            
             col1, col2 = st.columns(2)
             
             with col1:
                 st.write("**Contract Information:**")
                 st.write(f"**Contract Address:** `{tx['to']}`")
-                st.write(f"**Function Signature:** `{tx['input'][:10]}`")
-                st.write(f"**Input Data Length:** {len(tx['input'])} characters")
+                st.write(f"**Function Signature:** `{function_sig}`")
+                st.write(f"**Input Data Length:** {len(input_data)} bytes")
             
             with col2:
                 st.write("**Execution Details:**")
@@ -927,42 +1187,48 @@ def show_smart_contract_analysis_for_transaction(tx_hash, db_manager):
                 st.write(f"**Logs Generated:** {len(receipt['logs'])}")
             
             # Show function signature analysis
-            function_sig = tx['input'][:10]
             function_name = get_function_name_from_signature(function_sig)
             if function_name:
                 st.write(f"**Likely Function:** {function_name}")
             
             # Show logs if any
-            if receipt['logs']:
-                with st.expander(f"View {len(receipt['logs'])} Event Log(s)"):
-                    for i, log in enumerate(receipt['logs']):
-                        st.write(f"**Log #{i+1}:**")
-                        st.write(f"- Address: `{log['address']}`")
-                        st.write(f"- Topics: {len(log['topics'])}")
-                        st.write(f"- Data: `{log['data'][:50]}...`")
-                        st.write("---")
+            logs = receipt['logs']
+            if logs:
+                with st.expander(f"View {len(logs)} Event Log(s)"):
+                    # One Arrow table instead of a markdown block per log
+                    st.dataframe(pa.table({
+                        'Log #': pa.array(range(1, len(logs) + 1), pa.int32()),
+                        'Address': [log['address'] for log in logs],
+                        'Topics': pa.array([len(log['topics']) for log in logs], pa.int8()),
+                        'Data': ['0x' + bytes.hex(log['data'][:24]) for log in logs],
+                    }), use_container_width=True, hide_index=True)
         else:
             st.info("This is a simple ETH transfer, not a smart contract interaction")
             
+    except TransactionNotFound:
+        st.warning("Transaction not found on blockchain - it may not be confirmed yet")
     except Exception as e:
         st.error(f"Error analyzing smart contract: {e}")
 
+# Common function signatures, built once instead of on every lookup
+FUNCTION_SIGNATURES = {
+    '0xa9059cbb': 'transfer(address,uint256)',
+    '0x23b872dd': 'transferFrom(address,address,uint256)',
+    '0x095ea7b3': 'approve(address,uint256)',
+    '0x70a08231': 'balanceOf(address)',
+    '0x18160ddd': 'totalSupply()',
+    '0x7ff36ab5': 'swapExactETHForTokens(...)',
+    '0x38ed1739': 'swapExactTokensForETH(...)',
+    '0x42842e0e': 'safeTransferFrom(address,address,uint256)',
+    '0xb88d4fde': 'safeTransferFrom(address,address,uint256,bytes)',
+}
+
+@lru_cache(maxsize=4096)
 def get_function_name_from_signature(signature):
-    """Get likely function name from 4-byte signature"""
-    # Common function signatures
-    signatures = {
-        '0xa9059cbb': 'transfer(address,uint256)',
-        '0x23b872dd': 'transferFrom(address,address,uint256)',
-        '0x095ea7b3': 'approve(address,uint256)',
-        '0x70a08231': 'balanceOf(address)',
-        '0x18160ddd': 'totalSupply()',
-        '0x7ff36ab5': 'swapExactETHForTokens(...)',
-        '0x38ed1739': 'swapExactTokensForETH(...)',
-        '0x42842e0e': 'safeTransferFrom(address,address,uint256)',
-        '0xb88d4fde': 'safeTransferFrom(address,address,uint256,bytes)',
-    }
-    
-    return signatures.get(signature, None)
+    """Get likely function name from 4-byte signature (hex string, or raw bytes such as web3 input data)"""
+    if isinstance(signature, bytes):
+        signature = '0x' + bytes(signature[:4]).hex()
+    return FUNCTION_SIGNATURES.get(signature)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -15,24 +15,104 @@ The module supports dual database storage, allowing data to be stored in both
 PostgreSQL and MongoDB simultaneously for redundancy and different query capabilities.
 """
 
+import calendar
+import io
 import logging
 import os
-from typing import Dict, List, Optional, Any
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, BigInteger, Numeric, ForeignKey
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Tuple, Iterator
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, BigInteger, Numeric, ForeignKey, Index, func, case, cast, and_, true, text, select, bindparam, update
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from pymongo import MongoClient
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pymongo import MongoClient, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from bson.binary import Binary
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from datetime import datetime
 import json
+import pandas as pd
+from cache import LRUCache, TTLCache
 from config import (
     POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD,
-    MONGODB_URI, MONGODB_DB
+    POSTGRES_POOL_SIZE, POSTGRES_MAX_OVERFLOW, POSTGRES_SYNCHRONOUS_COMMIT,
+    MONGODB_URI, MONGODB_DB, MONGODB_JOURNAL_WRITES,
+    DB_WRITE_BATCH_BLOCKS, DB_WRITE_BATCH_SECONDS
 )
 
 # Set up logging configuration for database operations
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Documents fetched per round trip when streaming MongoDB cursors into DataFrames
+MONGO_CURSOR_BATCH_SIZE = 500
+
+# Projections for reading blocks and transactions back from MongoDB: the server leaves out
+# the MongoDB-specific fields (and a block's embedded transactions array, which readers
+# replace with the transactions collection's documents or drop)
+MONGO_BLOCK_PROJECTION = {'_id': 0, 'created_at': 0, 'transactions': 0}
+MONGO_TRANSACTION_PROJECTION = {'_id': 0, 'created_at': 0}
+
+# Rows fetched per round trip when streaming blocks with iter_blocks_in_range / iter_all_blocks
+BLOCK_STREAM_BATCH_SIZE = 1000
+
+# Threads running MongoDB writes alongside the PostgreSQL writes of the same store call
+DB_WRITE_WORKERS = 4
+
+# Rows per table and write above which PostgreSQL rows are loaded with COPY instead of
+# INSERT; COPY is faster for large backfill batches but has a fixed setup cost
+COPY_MIN_ROWS = 500
+
+# Number of blocks / transactions kept in memory by get_block, get_blocks_in_range
+# and get_transaction (stored blocks never change, so cached reads never go stale)
+BLOCK_CACHE_SIZE = 16384
+TX_CACHE_SIZE = 65536
+
+# Seconds get_latest_block_from_db reuses its result (new blocks arrive every ~12 seconds)
+LATEST_BLOCK_CACHE_TTL = 2
+
+# Row count from which PostgreSQL's planner estimate is used instead of an exact COUNT(*)
+# when an estimate is acceptable; smaller tables are cheap to count exactly
+ESTIMATED_COUNT_MIN_ROWS = 100000
+
+# Function selectors (first 4 bytes of input data) of ERC-20 transfer and transferFrom
+TOKEN_TRANSFER_SIGNATURES = ('0xa9059cbb', '0x23b872dd')
+
+# MongoDB expression for a transaction's input data as a string; rows written before input
+# data was stored as '0x...' text hold BinData, which string operators reject, so they count
+# as having no input until normalize_input_data converts them
+MONGO_INPUT_DATA_TEXT = {'$cond': [{'$eq': [{'$type': '$input_data'}, 'string']}, '$input_data', '']}
+
+# Input data of transactions that call no function: '' / '0x' as stored now, plus the empty
+# bytes stored by earlier versions ('\x' text in PostgreSQL, empty BinData in MongoDB)
+EMPTY_INPUT_DATA = ('', '0x', '\\x')
+MONGO_EMPTY_INPUT_DATA = ['', '0x', Binary(b'')]
+
+# Documents updated per bulk write when normalize_input_data converts MongoDB input data
+INPUT_DATA_NORMALIZE_BATCH_SIZE = 1000
+
+# pandas dtypes for DataFrame columns, so numeric data never ends up in object columns.
+# Integers are nullable (MongoDB documents may lack a field); wei amounts can exceed
+# 64 bits and are left as Python ints.
+BLOCK_DTYPES = {
+    'block_number': 'Int64',
+    'timestamp': 'Int64',
+    'difficulty': 'Int64',
+    'gas_limit': 'Int64',
+    'gas_used': 'Int64',
+    'transaction_count': 'Int64'
+}
+TRANSACTION_DTYPES = {
+    'block_number': 'Int64',
+    'value_ether': 'float64',
+    'gas': 'Int64',
+    'gas_price_gwei': 'float64',
+    'nonce': 'Int64',
+    'transaction_index': 'Int64'
+}
+
 # SQLAlchemy setup - creates the base class for all database models
 Base = declarative_base()
 
@@ -153,6 +233,92 @@ class Transaction(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+# Transactions in block order: serves lookups of a block's transactions (sorted by index)
+# and "most recent transactions" queries without sorting the whole table
+transaction_block_index = Index('idx_transactions_block', Transaction.block_number, Transaction.transaction_index)
+
+# Function selector of each transaction ('0x' + 8 hex chars), indexed so token
+# transfers can be found without scanning the input data of every transaction
+TRANSACTION_INPUT_SIGNATURE = func.substr(Transaction.input_data, 1, 10)
+transaction_input_signature_index = Index('idx_transactions_input_signature', TRANSACTION_INPUT_SIGNATURE)
+
+# Core INSERT statements for the write path - rows go straight to the database without
+# building ORM objects, and storing an already stored block or transaction is a no-op
+BLOCK_INSERT = pg_insert(Block).on_conflict_do_nothing(index_elements=['block_number'])
+TRANSACTION_INSERT = pg_insert(Transaction).on_conflict_do_nothing(index_elements=['tx_hash'])
+
+# Columns returned by the read methods (everything except created_at); selecting them
+# with Core returns plain row mappings, skipping ORM object construction
+BLOCK_COLUMNS = tuple(column for column in Block.__table__.c if column.name != 'created_at')
+TRANSACTION_COLUMNS = tuple(column for column in Transaction.__table__.c if column.name != 'created_at')
+
+# Prebuilt SELECT statements for the hot getters - values are bound at execution time,
+# so the statements are built once and their compiled SQL is reused on every call
+BLOCK_BY_NUMBER_SELECT = select(*BLOCK_COLUMNS).where(Block.block_number == bindparam('block_number'))
+BLOCK_BY_HASH_SELECT = select(*BLOCK_COLUMNS).where(Block.block_hash == bindparam('block_hash'))
+BLOCK_RANGE_SELECT = (
+    select(*BLOCK_COLUMNS)
+    .where(Block.block_number.between(bindparam('start_block'), bindparam('end_block')))
+    .order_by(Block.block_number)
+)
+LATEST_BLOCK_SELECT = select(*BLOCK_COLUMNS).order_by(Block.block_number.desc()).limit(1)
+BLOCK_TRANSACTIONS_SELECT = (
+    select(*TRANSACTION_COLUMNS)
+    .where(Transaction.block_number == bindparam('block_number'))
+    .order_by(Transaction.transaction_index)
+)
+TRANSACTION_BY_HASH_SELECT = select(*TRANSACTION_COLUMNS).where(Transaction.tx_hash == bindparam('tx_hash'))
+
+
+class DailyStats(Base):
+    """
+    PostgreSQL model for per-day block statistics
+    
+    Rows are materialized from the blocks table by DatabaseManager.update_daily_stats,
+    so the dashboard reads one row per day instead of aggregating every block.
+    
+    Fields:
+    - date: UTC day in YYYY-MM-DD format (primary key)
+    - block_count: Number of blocks mined that day
+    - transaction_count: Number of transactions in those blocks
+    - total_gas_used: Sum of gas used by those blocks
+    - max_gas_used: Highest gas used by a single block
+    - total_gas_limit: Sum of the gas limits of those blocks
+    """
+    __tablename__ = 'daily_stats'  # Name of the table in PostgreSQL
+    
+    # UTC day, e.g. '2024-01-31'
+    date = Column(String(10), primary_key=True)
+    
+    # Number of blocks and transactions for the day
+    block_count = Column(Integer, nullable=False)
+    transaction_count = Column(BigInteger, nullable=False)
+    
+    # Gas totals - averages are derived as total / block_count
+    total_gas_used = Column(BigInteger, nullable=False)
+    max_gas_used = Column(BigInteger, nullable=False)
+    total_gas_limit = Column(BigInteger, nullable=False)
+
+
+def _utc_day(timestamp_column):
+    """SQL expression turning a Unix timestamp column into a 'YYYY-MM-DD' UTC day string"""
+    return func.to_char(func.timezone('UTC', func.to_timestamp(timestamp_column)), 'YYYY-MM-DD')
+
+
+# MongoDB expression turning the Unix 'timestamp' field into a 'YYYY-MM-DD' UTC day string
+MONGO_UTC_DAY = {'$dateToString': {
+    'format': '%Y-%m-%d',
+    'date': {'$toDate': {'$multiply': ['$timestamp', 1000]}}
+}}
+
+
+def _hex_text(value):
+    """Return bytes (e.g. web3 HexBytes) as a '0x...' hex string; other values are returned unchanged"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '0x' + bytes(value).hex()
+    return value
+
+
 class DatabaseManager:
     """
     Main database management class
@@ -188,6 +354,16 @@ class DatabaseManager:
         self.use_mongodb = use_mongodb
         self._reset_on_init = reset_on_init
         
+        # In-memory caches for block and transaction reads
+        # Block entries are keyed on (block_number, include_transactions) for get_block and
+        # (block_number, None) for the header rows returned by get_blocks_in_range
+        self._block_cache = LRUCache(maxsize=BLOCK_CACHE_SIZE)
+        self._tx_cache = LRUCache(maxsize=TX_CACHE_SIZE)
+        self._latest_block_cache = TTLCache(ttl=LATEST_BLOCK_CACHE_TTL)
+        
+        # Threads for writing to MongoDB while PostgreSQL is written (see _write_to_databases)
+        self._io_pool = ThreadPoolExecutor(max_workers=DB_WRITE_WORKERS, thread_name_prefix='db-write')
+        
         # Initialize PostgreSQL connection if requested
         if use_postgres:
             self._setup_postgres(reset_on_init=self._reset_on_init)
@@ -195,6 +371,9 @@ class DatabaseManager:
         # Initialize MongoDB connection if requested
         if use_mongodb:
             self._setup_mongodb()
+        
+        # Materialize daily statistics for blocks stored before (or outside of) the ETL pipeline
+        self._catch_up_daily_stats()
     
     def _setup_postgres(self, *, reset_on_init: bool = False):
         """
@@ -217,7 +396,22 @@ class DatabaseManager:
             logger.info(f"Attempting to connect to PostgreSQL with: {POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}")
             
             # Create SQLAlchemy engine for database connection
-            self.postgres_engine = create_engine(connection_string)
+            # Sessions borrow connections from the engine's pool instead of opening a new
+            # one each time; pre-ping replaces connections the server has since closed,
+            # and connections are recycled after 30 minutes. The compiled-SQL cache is
+            # sized so the read and write statements all stay compiled.
+            # With synchronous_commit off a commit returns without waiting for its WAL
+            # fsync; a crash can lose the last few hundred ms of commits (never corrupt
+            # data), and those blocks are simply picked up again by the next sync
+            self.postgres_engine = create_engine(
+                connection_string,
+                pool_size=POSTGRES_POOL_SIZE,
+                max_overflow=POSTGRES_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                query_cache_size=1200,
+                connect_args={'options': f"-c synchronous_commit={POSTGRES_SYNCHRONOUS_COMMIT}"}
+            )
             
             # Test the connection by executing a simple query
             with self.postgres_engine.connect() as conn:
@@ -225,15 +419,21 @@ class DatabaseManager:
                 conn.execute(text("SELECT 1")).fetchone()
             
             # Create session factory for database operations
-            # This allows us to create database sessions for transactions
-            self.PostgresSession = sessionmaker(bind=self.postgres_engine)
+            # Each thread reuses its own session (the ETL runs batches on worker threads);
+            # loaded rows are only read, so they don't need refreshing after a commit
+            self.PostgresSession = scoped_session(sessionmaker(
+                bind=self.postgres_engine,
+                expire_on_commit=False,
+                autoflush=False
+            ))
             
-            # Create tables, optionally resetting if requested
+            # Create tables; stored data is kept across restarts unless a reset is
+            # explicitly requested (reset_on_init or DB_RESET_ON_INIT)
             should_reset = reset_on_init or os.getenv('DB_RESET_ON_INIT', '0') in ('1', 'true', 'True')
             if should_reset:
-                Base.metadata.drop_all(self.postgres_engine)
-                logger.info("PostgreSQL tables dropped due to reset_on_init flag")
-            Base.metadata.create_all(self.postgres_engine)
+                self.reset_schema()
+            else:
+                self._create_schema()
             
             logger.info("PostgreSQL connection established and tables created")
             
@@ -243,6 +443,29 @@ class DatabaseManager:
             # Re-raise the exception so the calling code knows about the failure
             raise
     
+    def _create_schema(self):
+        """Create any missing PostgreSQL tables and indexes (existing ones are left untouched)"""
+        Base.metadata.create_all(self.postgres_engine)
+        # create_all skips existing tables, so add indexes introduced after a table was created
+        for index in (transaction_block_index, transaction_input_signature_index):
+            index.create(self.postgres_engine, checkfirst=True)
+    
+    def reset_schema(self):
+        """
+        Drop and recreate all PostgreSQL tables, deleting every stored row
+        
+        Meant to be called explicitly by an operator (or via reset_on_init /
+        DB_RESET_ON_INIT); normal startup never drops data.
+        """
+        Base.metadata.drop_all(self.postgres_engine)
+        logger.info("PostgreSQL tables dropped for schema reset")
+        self._create_schema()
+        
+        # Cached reads refer to rows that no longer exist
+        self._block_cache.clear()
+        self._tx_cache.clear()
+        self._latest_block_cache.clear()
+    
     def _setup_mongodb(self):
         """
         Set up MongoDB database connection and create indexes
@@ -268,14 +491,35 @@ class DatabaseManager:
             self.mongo_db = self.mongo_client[MONGODB_DB]
             
             # Get references to our collections (similar to tables in SQL)
-            self.blocks_collection = self.mongo_db['blocks']
-            self.transactions_collection = self.mongo_db['transactions']
+            # Block and transaction writes are acknowledged by the server without waiting for
+            # the journal flush unless MONGODB_JOURNAL_WRITES is set (a server crash can then
+            # lose up to the last ~100 ms of acknowledged writes)
+            ingest_concern = WriteConcern(w=1, j=MONGODB_JOURNAL_WRITES)
+            self.blocks_collection = self.mongo_db.get_collection('blocks', write_concern=ingest_concern)
+            self.transactions_collection = self.mongo_db.get_collection('transactions', write_concern=ingest_concern)
+            self.daily_stats_collection = self.mongo_db['daily_stats']  # Keyed by day (_id)
+            
+            # Handles that return undecoded BSON; fields are only parsed when accessed,
+            # so reading a few columns skips decoding the rest of each document
+            raw_codec = CodecOptions(document_class=RawBSONDocument)
+            self.raw_blocks_collection = self.mongo_db.get_collection('blocks', codec_options=raw_codec)
+            self.raw_transactions_collection = self.mongo_db.get_collection('transactions', codec_options=raw_codec)
             
             # Create indexes for efficient querying
-            # Indexes speed up queries on these fields
-            self.blocks_collection.create_index("block_number")  # For finding blocks by number
-            self.transactions_collection.create_index("tx_hash")  # For finding transactions by hash
-            self.transactions_collection.create_index("block_number")  # For finding transactions by block
+            # Indexes speed up queries on these fields. Only missing indexes are created, so
+            # restarting against an existing database doesn't request any index builds
+            block_indexes = self.blocks_collection.index_information()
+            transaction_indexes = self.transactions_collection.index_information()
+            self._create_unique_index(self.blocks_collection, "block_number", block_indexes)  # For finding blocks by number
+            if "block_hash_1" not in block_indexes:
+                self.blocks_collection.create_index("block_hash")  # For finding blocks by hash
+            self._create_unique_index(self.transactions_collection, "tx_hash", transaction_indexes)  # For finding transactions by hash
+            # For finding a block's transactions already sorted by position (also serves
+            # block_number-only queries, so the old single-field index is dropped)
+            if "block_number_1_transaction_index_1" not in transaction_indexes:
+                self.transactions_collection.create_index([("block_number", 1), ("transaction_index", 1)])
+            if "block_number_1" in transaction_indexes:
+                self.transactions_collection.drop_index("block_number_1")
             
             logger.info("MongoDB connection established and indexes created")
             
@@ -285,6 +529,32 @@ class DatabaseManager:
             # Re-raise the exception so the calling code knows about the failure
             raise
     
+    @staticmethod
+    def _create_unique_index(collection, field: str, existing_indexes: Dict[str, Any]):
+        """
+        Create a unique index on a field, replacing an existing non-unique one
+        
+        If the collection already holds duplicate values (stored before the index
+        was unique) a plain index is kept instead, so setup still succeeds.
+        
+        Args:
+            collection: MongoDB collection to index
+            field: Name of the indexed field
+            existing_indexes: The collection's current indexes (from index_information())
+        """
+        index_name = f"{field}_1"
+        existing_index = existing_indexes.get(index_name)
+        if existing_index is not None:
+            if existing_index.get('unique'):
+                return
+            collection.drop_index(index_name)
+        
+        try:
+            collection.create_index(field, unique=True)
+        except OperationFailure as e:
+            logger.warning(f"Could not create unique index on {collection.name}.{field}, using a non-unique index: {e}")
+            collection.create_index(field)
+    
     def store_block(self, block_data: Dict[str, Any]) -> bool:
         """
         Store block data in the configured databases
@@ -306,61 +576,56 @@ class DatabaseManager:
                 - transaction_count: Number of transactions
                 
         Returns:
-            bool: True if storage was successful in at least one database, False otherwise
+            bool: True if the block was stored in every configured database, False otherwise
             
-        Note: The method attempts to store in both databases and returns True
-        if at least one succeeds, providing redundancy.
+        Note: When both databases are configured they are written concurrently, and each
+        write is attempted even if the other fails, so a False result can still leave the
+        block stored in one of them.
         """
-        success = True
+        self._forget_cached_block(block_data['block_number'])
         
-        # ===== STORE IN POSTGRESQL =====
-        if self.use_postgres:
-            try:
-                # Create a new database session
-                session = self.PostgresSession()
-                
-                # Create a Block record object from the data
-                # This maps the dictionary data to our SQLAlchemy model
-                block_record = Block(
-                    block_number=block_data['block_number'],
-                    block_hash=block_data['block_hash'],
-                    parent_hash=block_data['parent_hash'],
-                    timestamp=block_data['timestamp'],
-                    miner=block_data['miner'],
-                    difficulty=block_data['difficulty'],
-                    gas_limit=block_data['gas_limit'],
-                    gas_used=block_data['gas_used'],
-                    transaction_count=block_data['transaction_count']
-                )
-                
-                # Add the record to the session and commit to database
-                session.add(block_record)
-                session.commit()
-                session.close()
-                
-                logger.info(f"Stored block {block_data['block_number']} in PostgreSQL")
-                
-            except Exception as e:
-                logger.error(f"Error storing block in PostgreSQL: {e}")
-                success = False
+        return self._write_to_databases(
+            lambda: self._store_block_postgres(block_data),
+            lambda: self._store_block_mongodb(block_data)
+        )
+    
+    def _store_block_postgres(self, block_data: Dict[str, Any]) -> bool:
+        """Store a block row in PostgreSQL, returning False on error"""
+        try:
+            # Insert the row and commit (a block that is already stored is left as is)
+            with self.postgres_engine.begin() as conn:
+                conn.execute(BLOCK_INSERT, self._block_row(block_data))
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored block %s in PostgreSQL", block_data['block_number'])
+            
+        except Exception as e:
+            logger.error(f"Error storing block in PostgreSQL: {e}")
+            return False
         
-        # ===== STORE IN MONGODB =====
-        if self.use_mongodb:
-            try:
-                # Add timestamp for MongoDB (MongoDB doesn't have automatic timestamps)
-                block_data['created_at'] = datetime.utcnow()
-                
-                # Insert the block data directly into MongoDB collection
-                # MongoDB stores data as JSON-like documents
-                self.blocks_collection.insert_one(block_data)
-                
-                logger.info(f"Stored block {block_data['block_number']} in MongoDB")
-                
-            except Exception as e:
-                logger.error(f"Error storing block in MongoDB: {e}")
-                success = False
+        return True
+    
+    def _store_block_mongodb(self, block_data: Dict[str, Any]) -> bool:
+        """Store a block document in MongoDB, returning False on error"""
+        try:
+            # Insert a copy of the block data with a timestamp added (MongoDB doesn't have
+            # automatic timestamps), so the caller's dict doesn't pick up 'created_at' or '_id'.
+            # The block number is the document's _id, so no ObjectId is generated for it
+            self.blocks_collection.insert_one({
+                **block_data, '_id': block_data['block_number'], 'created_at': datetime.utcnow()
+            })
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored block %s in MongoDB", block_data['block_number'])
+            
+        except DuplicateKeyError:
+            logger.warning(f"Block {block_data['block_number']} already stored in MongoDB")
+            
+        except Exception as e:
+            logger.error(f"Error storing block in MongoDB: {e}")
+            return False
         
-        return success
+        return True
     
     def store_transaction(self, tx_data: Dict[str, Any]) -> bool:
         """
@@ -386,79 +651,159 @@ class DatabaseManager:
                 - transaction_index: Position in block
                 
         Returns:
-            bool: True if storage was successful in at least one database, False otherwise
+            bool: True if the transaction was stored in every configured database, False otherwise
         """
-        success = True
+        self._tx_cache.pop(tx_data['tx_hash'])
+        self._block_cache.pop((tx_data['block_number'], True))
         
-        # ===== STORE IN POSTGRESQL =====
-        if self.use_postgres:
-            try:
-                # Create a new database session
-                session = self.PostgresSession()
-                
-                try:
-                    # Create a Transaction record object from the data
-                    # Convert numeric values to appropriate types
-                    tx_record = Transaction(
-                        tx_hash=tx_data['tx_hash'],
-                        block_number=tx_data['block_number'],
-                        from_address=tx_data['from_address'],
-                        to_address=tx_data['to_address'],
-                        value_wei=str(tx_data['value_wei']),  # Convert to string for NUMERIC
-                        value_ether=float(tx_data['value_ether']),  # Convert to float for storage
-                        gas=tx_data['gas'],
-                        gas_price=str(tx_data['gas_price']),  # Convert to string for NUMERIC
-                        gas_price_gwei=float(tx_data['gas_price_gwei']),  # Convert to float
-                        input_data=tx_data['input_data'],
-                        nonce=tx_data['nonce'],
-                        transaction_index=tx_data['transaction_index']
-                    )
-                    
-                    # Add the record to the session and commit to database
-                    session.add(tx_record)
-                    session.commit()
-                    
-                    logger.info(f"Stored transaction {tx_data['tx_hash'][:20]}... in PostgreSQL")
-                    
-                except Exception as e:
-                    # Rollback the transaction on error
-                    session.rollback()
-                    logger.error(f"Error storing transaction {tx_data['tx_hash'][:20]}... in PostgreSQL: {e}")
-                    logger.error(f"Transaction data: {tx_data}")
-                    success = False
-                    
-                finally:
-                    # Always close the session
-                    session.close()
-                    
-            except Exception as e:
-                logger.error(f"Error creating PostgreSQL session: {e}")
-                success = False
+        return self._write_to_databases(
+            lambda: self._store_transaction_postgres(tx_data),
+            lambda: self._store_transaction_mongodb(tx_data)
+        )
+    
+    def _store_transaction_postgres(self, tx_data: Dict[str, Any]) -> bool:
+        """Store a transaction row in PostgreSQL, returning False on error"""
+        try:
+            # Insert the row and commit (a transaction that is already stored is left as is)
+            with self.postgres_engine.begin() as conn:
+                conn.execute(TRANSACTION_INSERT, self._transaction_row(tx_data))
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored transaction %s... in PostgreSQL", tx_data['tx_hash'][:20])
+            
+        except Exception as e:
+            logger.error(f"Error storing transaction {tx_data['tx_hash'][:20]}... in PostgreSQL: {e}")
+            logger.error(f"Transaction data: {tx_data}")
+            return False
         
-        # ===== STORE IN MONGODB =====
-        if self.use_mongodb:
-            try:
-                # Add timestamp for MongoDB
-                tx_data['created_at'] = datetime.utcnow()
-                
-                # Insert the transaction data directly into MongoDB collection
-                self.transactions_collection.insert_one(tx_data)
-                
-                logger.info(f"Stored transaction {tx_data['tx_hash'][:20]}... in MongoDB")
-                
-            except Exception as e:
-                logger.error(f"Error storing transaction in MongoDB: {e}")
-                success = False
+        return True
+    
+    def _store_transaction_mongodb(self, tx_data: Dict[str, Any]) -> bool:
+        """Store a transaction document in MongoDB, returning False on error"""
+        try:
+            # Insert a copy of the transaction data with a timestamp added, keyed by its hash
+            self.transactions_collection.insert_one({
+                **tx_data, '_id': tx_data['tx_hash'], 'created_at': datetime.utcnow()
+            })
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored transaction %s... in MongoDB", tx_data['tx_hash'][:20])
+            
+        except DuplicateKeyError:
+            logger.warning(f"Transaction {tx_data['tx_hash'][:20]}... already stored in MongoDB")
+            
+        except Exception as e:
+            logger.error(f"Error storing transaction in MongoDB: {e}")
+            return False
+        
+        return True
+    
+    def _write_to_databases(self, postgres_write: Callable[[], bool], mongodb_write: Callable[[], bool]) -> bool:
+        """
+        Run the PostgreSQL and MongoDB halves of a store call
+        
+        When both databases are configured the MongoDB write runs on the I/O thread
+        pool while the PostgreSQL write runs on the calling thread, so a store takes
+        about as long as the slower of the two writes instead of their sum.
+        
+        Args:
+            postgres_write: Performs the PostgreSQL write, returning True on success
+            mongodb_write: Performs the MongoDB write, returning True on success
+            
+        Returns:
+            bool: True if the write succeeded in every configured database
+        """
+        mongodb_future = None
+        if self.use_postgres and self.use_mongodb:
+            mongodb_future = self._io_pool.submit(mongodb_write)
+        
+        success = True
+        if self.use_postgres:
+            success = postgres_write() and success
+        if mongodb_future is not None:
+            success = mongodb_future.result() and success
+        elif self.use_mongodb:
+            success = mongodb_write() and success
         
         return success
     
+    def _forget_cached_block(self, block_number: int):
+        """Drop every cached copy of a block so the next read sees what was just stored"""
+        for include_transactions in (True, False, None):
+            self._block_cache.pop((block_number, include_transactions))
+        
+        # A newer block replaces the cached latest block
+        latest_block = self._latest_block_cache.get('latest')
+        if latest_block is not None and block_number > latest_block['block_number']:
+            self._latest_block_cache.pop('latest')
+    
+    @staticmethod
+    def _copy_block(block_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached block (and its transactions) so callers can't modify the cache"""
+        block_copy = dict(block_data)
+        if 'transactions' in block_copy:
+            block_copy['transactions'] = [dict(tx) for tx in block_copy['transactions']]
+        return block_copy
+    
+    @staticmethod
+    def _block_row(block_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map block data to the column values of a PostgreSQL blocks row
+        
+        Args:
+            block_data: Dictionary containing block information
+            
+        Returns:
+            Dict[str, Any]: Values for the Block model's columns
+        """
+        return {
+            'block_number': block_data['block_number'],
+            'block_hash': block_data['block_hash'],
+            'parent_hash': block_data['parent_hash'],
+            'timestamp': block_data['timestamp'],
+            'miner': block_data['miner'],
+            'difficulty': block_data['difficulty'],
+            'gas_limit': block_data['gas_limit'],
+            'gas_used': block_data['gas_used'],
+            'transaction_count': block_data['transaction_count']
+        }
+    
+    @staticmethod
+    def _transaction_row(tx_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map transaction data to the column values of a PostgreSQL transactions row
+        
+        Args:
+            tx_data: Dictionary containing transaction information
+            
+        Returns:
+            Dict[str, Any]: Values for the Transaction model's columns
+        """
+        return {
+            'tx_hash': tx_data['tx_hash'],
+            'block_number': tx_data['block_number'],
+            'from_address': tx_data['from_address'],
+            'to_address': tx_data['to_address'],
+            'value_wei': int(tx_data['value_wei']),  # psycopg2 binds ints to NUMERIC directly
+            'value_ether': float(tx_data['value_ether']),  # Convert to float for storage
+            'gas': tx_data['gas'],
+            'gas_price': int(tx_data['gas_price']),  # psycopg2 binds ints to NUMERIC directly
+            'gas_price_gwei': float(tx_data['gas_price_gwei']),  # Convert to float
+            'input_data': _hex_text(tx_data['input_data']),  # Text column: never bind raw bytes
+            'nonce': tx_data['nonce'],
+            'transaction_index': tx_data['transaction_index']
+        }
+    
     def store_block_with_transactions(self, block_data: Dict[str, Any]) -> bool:
         """
         Store a block and all its transactions
         
-        This method stores a complete block with all its transactions. It first
-        stores the block data, then stores each transaction individually. This
-        ensures that both block and transaction data are properly stored.
+        In PostgreSQL the block row and every transaction row are written in a
+        single database transaction: the transactions go in one executemany
+        INSERT (sent by psycopg2 as multi-row INSERT ... VALUES statements), so
+        a block costs one commit instead of one per transaction. Rows that are
+        already stored are skipped, so storing a block again is harmless. In
+        MongoDB the transactions are written with a single insert_many.
         
         Args:
             block_data: Dictionary containing block information plus a 'transactions'
@@ -468,32 +813,203 @@ class DatabaseManager:
             bool: True if both block and all transactions were stored successfully
             
         Note: This method requires the block_data to contain a 'transactions' list
-        with transaction dictionaries.
+        with transaction dictionaries. In PostgreSQL a block is stored completely
+        or not at all.
+        """
+        return self._store_blocks([block_data])
+    
+    def store_blocks_with_transactions(self, blocks: List[Dict[str, Any]]) -> int:
+        """
+        Store several blocks and all their transactions with one write per database
+        
+        All rows go into PostgreSQL in a single database transaction (one commit
+        for the whole list). If that write fails - e.g. because one block has
+        invalid data - the blocks are stored one at a time instead, so a single
+        bad block doesn't keep the others out.
+        
+        Args:
+            blocks: Block dictionaries, each with a 'transactions' list
+            
+        Returns:
+            int: Number of blocks stored successfully
+        """
+        if not blocks:
+            return 0
+        
+        if self._store_blocks(blocks):
+            return len(blocks)
+        
+        if len(blocks) == 1:
+            return 0
+        
+        logger.warning(f"Batch write of {len(blocks)} blocks failed, storing them one at a time")
+        return sum(1 for block_data in blocks if self._store_blocks([block_data]))
+    
+    def _store_blocks(self, blocks: List[Dict[str, Any]]) -> bool:
+        """
+        Store blocks and their transactions in the configured databases
+        
+        Args:
+            blocks: Block dictionaries, each with a 'transactions' list
+            
+        Returns:
+            bool: True if every block and transaction was stored in every configured database
         """
-        logger.info(f"Storing block {block_data.get('block_number', 'unknown')} with {len(block_data.get('transactions', []))} transactions")
+        first_block = blocks[0].get('block_number', 'unknown')
+        last_block = blocks[-1].get('block_number', 'unknown')
+        block_label = f"block {first_block}" if len(blocks) == 1 else f"blocks {first_block}-{last_block}"
+        tx_count = sum(len(block_data.get('transactions', [])) for block_data in blocks)
+        start_time = time.perf_counter()
+        
+        for block_data in blocks:
+            self._forget_cached_block(block_data['block_number'])
+            for tx in block_data.get('transactions', []):
+                self._tx_cache.pop(tx['tx_hash'])
         
-        # First, store the block data (without transactions)
-        block_success = self.store_block(block_data)
+        success = self._write_to_databases(
+            lambda: self._store_blocks_postgres(blocks, block_label, tx_count),
+            lambda: self._store_blocks_mongodb(blocks, block_label, tx_count)
+        )
         
-        if not block_success:
-            logger.error(f"Failed to store block {block_data.get('block_number', 'unknown')}")
+        if success:
+            # One summary line per write; the per-database lines are debug-level
+            logger.info(f"Stored {block_label} with {tx_count} transactions in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+        else:
+            logger.error(f"Failed to store {block_label}")
+        
+        return success
+    
+    def _store_blocks_postgres(self, blocks: List[Dict[str, Any]], block_label: str, tx_count: int) -> bool:
+        """Store block and transaction rows in PostgreSQL, returning False on error"""
+        try:
+            # One database transaction, committed on success and rolled back on error
+            with self.postgres_engine.begin() as conn:
+                # Block rows go first, since the transaction rows reference them
+                block_rows = [self._block_row(block_data) for block_data in blocks]
+                if len(block_rows) > COPY_MIN_ROWS:
+                    self._copy_rows(conn, Block.__table__, BLOCK_COLUMNS, block_rows)
+                else:
+                    conn.execute(BLOCK_INSERT, block_rows)
+                
+                tx_rows = [
+                    self._transaction_row(tx)
+                    for block_data in blocks
+                    for tx in block_data.get('transactions', [])
+                ]
+                if len(tx_rows) > COPY_MIN_ROWS:
+                    self._copy_rows(conn, Transaction.__table__, TRANSACTION_COLUMNS, tx_rows)
+                elif tx_rows:
+                    conn.execute(TRANSACTION_INSERT, tx_rows)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored %s with %s transactions in PostgreSQL", block_label, tx_count)
+            
+        except Exception as e:
+            logger.error(f"Error storing {block_label} with transactions in PostgreSQL: {e}")
             return False
         
-        # Then, store each transaction in the block
-        transactions_success = True
-        transaction_count = 0
+        return True
+    
+    def _copy_rows(self, conn, table, columns, rows: List[Dict[str, Any]]):
+        """
+        Load block or transaction rows into PostgreSQL with COPY FROM STDIN
         
-        for tx in block_data.get('transactions', []):
-            if self.store_transaction(tx):
-                transaction_count += 1
-            else:
-                logger.error(f"Failed to store transaction {tx.get('tx_hash', 'unknown')}")
-                transactions_success = False
+        The rows are copied into a temporary staging table and moved over with
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING, so rows that are already
+        stored are skipped just like with BLOCK_INSERT / TRANSACTION_INSERT.
+        
+        Args:
+            conn: Connection of the open database transaction
+            table: Target table (blocks or transactions)
+            columns: Columns to load (BLOCK_COLUMNS or TRANSACTION_COLUMNS)
+            rows: Rows as returned by _block_row / _transaction_row
+        """
+        names = [column.name for column in columns]
+        column_list = ', '.join(names + ['created_at'])
+        conflict_columns = ', '.join(column.name for column in table.primary_key.columns)
+        staging_table = f"{table.name}_copy"
+        created_at = str(datetime.utcnow())
+        
+        # COPY text format: tab-separated columns, one row per line, \N for NULL
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join([self._copy_value(row[name]) for name in names] + [created_at]))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        cursor = conn.connection.cursor()
+        try:
+            # Rows in the staging table are dropped when the database transaction ends
+            cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} (LIKE {table.name}) ON COMMIT DELETE ROWS")
+            cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN", buffer)
+            cursor.execute(
+                f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {staging_table} "
+                f"ON CONFLICT ({conflict_columns}) DO NOTHING"
+            )
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _copy_value(value: Any) -> str:
+        """Format a value as a field of COPY's text format"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            # str() would write the bytes' repr, which COPY reads as raw byte escapes
+            raise TypeError(f"Cannot COPY binary value {value[:8]!r}...; encode it as text first")
+        if isinstance(value, str):
+            return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+        return str(value)
+    
+    def _store_blocks_mongodb(self, blocks: List[Dict[str, Any]], block_label: str, tx_count: int) -> bool:
+        """Store block and transaction documents in MongoDB, returning False on error"""
+        try:
+            # Add timestamp for MongoDB (MongoDB doesn't have automatic timestamps).
+            # Documents are shallow copies, so the caller's dictionaries don't pick up
+            # 'created_at' or '_id'. Blocks and transactions use their natural key (block
+            # number / tx hash) as _id, so no ObjectId is generated per document
+            created_at = datetime.utcnow()
+            self._insert_mongo_documents(
+                self.blocks_collection,
+                [{**block_data, '_id': block_data['block_number'], 'created_at': created_at} for block_data in blocks]
+            )
+            
+            tx_docs = [
+                {**tx, '_id': tx['tx_hash'], 'created_at': created_at}
+                for block_data in blocks
+                for tx in block_data.get('transactions', [])
+            ]
+            if tx_docs:
+                self._insert_mongo_documents(self.transactions_collection, tx_docs)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored %s with %s transactions in MongoDB", block_label, tx_count)
+            
+        except Exception as e:
+            logger.error(f"Error storing {block_label} with transactions in MongoDB: {e}")
+            return False
+        
+        return True
+    
+    def _insert_mongo_documents(self, collection, docs: List[Dict[str, Any]]):
+        """
+        Insert documents into a MongoDB collection in a single unordered bulk write
         
-        logger.info(f"Successfully stored block {block_data.get('block_number', 'unknown')} with {transaction_count}/{len(block_data.get('transactions', []))} transactions")
+        Unordered inserts let the server apply the documents in parallel and carry on
+        past individual failures. Documents rejected only as duplicates (e.g. when a
+        block is stored again) are skipped; any other write error is re-raised.
         
-        # Return True only if both block and all transactions were stored successfully
-        return block_success and transactions_success
+        Args:
+            collection: MongoDB collection to insert into
+            docs: Documents to insert
+        """
+        try:
+            collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get('writeErrors', [])
+            if e.details.get('writeConcernErrors') or any(error.get('code') != 11000 for error in write_errors):
+                raise
+            logger.warning(f"Skipped {len(write_errors)} document(s) already stored in MongoDB {collection.name}")
     
     def get_block(self, block_number: int, include_transactions: bool = True) -> Optional[Dict[str, Any]]:
         """
@@ -512,58 +1028,21 @@ class DatabaseManager:
             
         Note: The returned data structure matches the input format used by store_block()
         """
+        # Serve repeated reads of the same block from memory
+        cache_key = (block_number, include_transactions)
+        cached_block = self._block_cache.get(cache_key)
+        if cached_block is not None:
+            return self._copy_block(cached_block)
+        
         # ===== TRY POSTGRESQL FIRST =====
         if self.use_postgres:
             try:
-                # Create a new database session
-                session = self.PostgresSession()
-                
-                # Query for the block with the specified block number
-                block = session.query(Block).filter(Block.block_number == block_number).first()
-                
-                block_data = None
-                if block:
-                    block_data = {
-                        'block_number': block.block_number,
-                        'block_hash': block.block_hash,
-                        'parent_hash': block.parent_hash,
-                        'timestamp': block.timestamp,
-                        'miner': block.miner,
-                        'difficulty': block.difficulty,
-                        'gas_limit': block.gas_limit,
-                        'gas_used': block.gas_used,
-                        'transaction_count': block.transaction_count
-                    }
-                    
-                    # Include transactions if requested
-                    if include_transactions:
-                        transactions = session.query(Transaction).filter(
-                            Transaction.block_number == block_number
-                        ).order_by(Transaction.transaction_index).all()
-                        
-                        logger.info(f"PostgreSQL: Found {len(transactions)} transactions for block {block_number}")
-                        
-                        block_data['transactions'] = [{
-                            'tx_hash': tx.tx_hash,
-                            'block_number': tx.block_number,
-                            'from_address': tx.from_address,
-                            'to_address': tx.to_address,
-                            'value_wei': str(tx.value_wei),  # Ensure string conversion
-                            'value_ether': float(tx.value_ether),  # Ensure float conversion
-                            'gas': tx.gas,
-                            'gas_price': str(tx.gas_price),  # Ensure string conversion
-                            'gas_price_gwei': float(tx.gas_price_gwei),  # Ensure float conversion
-                            'input_data': tx.input_data,
-                            'nonce': tx.nonce,
-                            'transaction_index': tx.transaction_index
-                        } for tx in transactions]
-                    else:
-                        block_data['transactions'] = []
-                
-                session.close()
-                
+                block_data = self._get_postgres_block(
+                    BLOCK_BY_NUMBER_SELECT, {'block_number': block_number}, include_transactions
+                )
                 if block_data:
-                    return block_data
+                    self._block_cache.set(cache_key, block_data)
+                    return self._copy_block(block_data)
                     
             except Exception as e:
                 logger.error(f"Error retrieving block from PostgreSQL: {e}")
@@ -572,31 +1051,22 @@ class DatabaseManager:
         if self.use_mongodb:
             try:
                 # Query MongoDB for the block
-                block = self.blocks_collection.find_one({'block_number': block_number})
+                # The embedded transactions array is replaced or dropped below, so don't fetch it;
+                # MongoDB-specific fields (_id, created_at) are left out by the server
+                block = self.blocks_collection.find_one({'block_number': block_number}, MONGO_BLOCK_PROJECTION)
                 
                 if block:
-                    # Remove MongoDB-specific fields (_id) before returning
-                    block.pop('_id', None)
-                    block.pop('created_at', None)
-                    
                     # Include transactions if requested
                     if include_transactions:
                         # Get transactions from the transactions collection
                         transactions = list(self.transactions_collection.find(
-                            {'block_number': block_number}
+                            {'block_number': block_number}, MONGO_TRANSACTION_PROJECTION
                         ).sort('transaction_index', 1))
                         
-                        # Remove MongoDB-specific fields from transactions
-                        for tx in transactions:
-                            tx.pop('_id', None)
-                            tx.pop('created_at', None)
-                        
                         block['transactions'] = transactions
-                    else:
-                        # Remove transactions if not requested
-                        block.pop('transactions', None)
                     
-                    return block
+                    self._block_cache.set(cache_key, block)
+                    return self._copy_block(block)
                     
             except Exception as e:
                 logger.error(f"Error retrieving block from MongoDB: {e}")
@@ -628,53 +1098,9 @@ class DatabaseManager:
         # ===== TRY POSTGRESQL FIRST =====
         if self.use_postgres:
             try:
-                # Create a new database session
-                session = self.PostgresSession()
-                
-                # Query for the block with the specified block hash
-                block = session.query(Block).filter(Block.block_hash == block_hash).first()
-                
-                block_data = None
-                if block:
-                    block_data = {
-                        'block_number': block.block_number,
-                        'block_hash': block.block_hash,
-                        'parent_hash': block.parent_hash,
-                        'timestamp': block.timestamp,
-                        'miner': block.miner,
-                        'difficulty': block.difficulty,
-                        'gas_limit': block.gas_limit,
-                        'gas_used': block.gas_used,
-                        'transaction_count': block.transaction_count
-                    }
-                    
-                    # Include transactions if requested
-                    if include_transactions:
-                        transactions = session.query(Transaction).filter(
-                            Transaction.block_number == block.block_number
-                        ).order_by(Transaction.transaction_index).all()
-                        
-                        logger.info(f"PostgreSQL get_block_by_hash: Found {len(transactions)} transactions for block {block.block_number}")
-                        
-                        block_data['transactions'] = [{
-                            'tx_hash': tx.tx_hash,
-                            'block_number': tx.block_number,
-                            'from_address': tx.from_address,
-                            'to_address': tx.to_address,
-                            'value_wei': str(tx.value_wei),  # Ensure string conversion
-                            'value_ether': float(tx.value_ether),  # Ensure float conversion
-                            'gas': tx.gas,
-                            'gas_price': str(tx.gas_price),  # Ensure string conversion
-                            'gas_price_gwei': float(tx.gas_price_gwei),  # Ensure float conversion
-                            'input_data': tx.input_data,
-                            'nonce': tx.nonce,
-                            'transaction_index': tx.transaction_index
-                        } for tx in transactions]
-                    else:
-                        block_data['transactions'] = []
-                
-                session.close()
-                
+                block_data = self._get_postgres_block(
+                    BLOCK_BY_HASH_SELECT, {'block_hash': block_hash}, include_transactions
+                )
                 if block_data:
                     return block_data
                     
@@ -685,29 +1111,19 @@ class DatabaseManager:
         if self.use_mongodb:
             try:
                 # Query MongoDB for the block
-                block = self.blocks_collection.find_one({'block_hash': block_hash})
+                # The embedded transactions array is replaced or dropped below, so don't fetch it;
+                # MongoDB-specific fields (_id, created_at) are left out by the server
+                block = self.blocks_collection.find_one({'block_hash': block_hash}, MONGO_BLOCK_PROJECTION)
                 
                 if block:
-                    # Remove MongoDB-specific fields (_id) before returning
-                    block.pop('_id', None)
-                    block.pop('created_at', None)
-                    
                     # Include transactions if requested
                     if include_transactions:
                         # Get transactions from the transactions collection
                         transactions = list(self.transactions_collection.find(
-                            {'block_number': block['block_number']}
+                            {'block_number': block['block_number']}, MONGO_TRANSACTION_PROJECTION
                         ).sort('transaction_index', 1))
                         
-                        # Remove MongoDB-specific fields from transactions
-                        for tx in transactions:
-                            tx.pop('_id', None)
-                            tx.pop('created_at', None)
-                        
                         block['transactions'] = transactions
-                    else:
-                        # Remove transactions if not requested
-                        block.pop('transactions', None)
                     
                     return block
                     
@@ -717,6 +1133,44 @@ class DatabaseManager:
         # Return None if block not found in either database
         return None
     
+    def _get_postgres_block(self, statement, params: Dict[str, Any],
+                            include_transactions: bool) -> Optional[Dict[str, Any]]:
+        """
+        Read one block (and optionally its transactions) from PostgreSQL
+        
+        Args:
+            statement: Prebuilt block SELECT (BLOCK_BY_NUMBER_SELECT or BLOCK_BY_HASH_SELECT)
+            params: Values for the statement's bound parameters
+            include_transactions: Whether to include transaction data
+            
+        Returns:
+            Optional[Dict[str, Any]]: Block data dictionary or None if not found
+        """
+        with self.PostgresSession() as session:
+            block = session.execute(statement, params).mappings().first()
+            if not block:
+                return None
+            
+            block_data = dict(block)
+            block_data['transactions'] = []
+            
+            # Include transactions if requested
+            if include_transactions:
+                transactions = session.execute(
+                    BLOCK_TRANSACTIONS_SELECT, {'block_number': block_data['block_number']}
+                ).mappings().all()
+                
+                logger.info(f"PostgreSQL: Found {len(transactions)} transactions for block {block_data['block_number']}")
+                
+                for tx in transactions:
+                    tx_data = dict(tx)
+                    # Wei amounts come back as Decimal; return them as strings
+                    tx_data['value_wei'] = str(tx_data['value_wei'])
+                    tx_data['gas_price'] = str(tx_data['gas_price'])
+                    block_data['transactions'].append(tx_data)
+        
+        return block_data
+    
     def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve transaction data from database
@@ -733,32 +1187,22 @@ class DatabaseManager:
             
         Note: The returned data structure matches the input format used by store_transaction()
         """
+        # Serve repeated reads of the same transaction from memory
+        cached_tx = self._tx_cache.get(tx_hash)
+        if cached_tx is not None:
+            return dict(cached_tx)
+        
         # ===== TRY POSTGRESQL FIRST =====
         if self.use_postgres:
             try:
-                # Create a new database session
-                session = self.PostgresSession()
+                with self.PostgresSession() as session:
+                    # Query for the transaction with the specified hash
+                    tx = session.execute(TRANSACTION_BY_HASH_SELECT, {'tx_hash': tx_hash}).mappings().first()
                 
-                # Query for the transaction with the specified hash
-                tx = session.query(Transaction).filter(Transaction.tx_hash == tx_hash).first()
-                session.close()
-                
-                # If transaction found, convert SQLAlchemy object to dictionary
                 if tx:
-                    return {
-                        'tx_hash': tx.tx_hash,
-                        'block_number': tx.block_number,
-                        'from_address': tx.from_address,
-                        'to_address': tx.to_address,
-                        'value_wei': tx.value_wei,
-                        'value_ether': tx.value_ether,
-                        'gas': tx.gas,
-                        'gas_price': tx.gas_price,
-                        'gas_price_gwei': tx.gas_price_gwei,
-                        'input_data': tx.input_data,
-                        'nonce': tx.nonce,
-                        'transaction_index': tx.transaction_index
-                    }
+                    tx_data = dict(tx)
+                    self._tx_cache.set(tx_hash, tx_data)
+                    return dict(tx_data)
                     
             except Exception as e:
                 logger.error(f"Error retrieving transaction from PostgreSQL: {e}")
@@ -767,12 +1211,11 @@ class DatabaseManager:
         if self.use_mongodb:
             try:
                 # Query MongoDB for the transaction
-                tx = self.transactions_collection.find_one({'tx_hash': tx_hash})
+                tx = self.transactions_collection.find_one({'tx_hash': tx_hash}, {'_id': 0})
                 
                 if tx:
-                    # Remove MongoDB-specific fields (_id) before returning
-                    tx.pop('_id', None)
-                    return tx
+                    self._tx_cache.set(tx_hash, tx)
+                    return dict(tx)
                     
             except Exception as e:
                 logger.error(f"Error retrieving transaction from MongoDB: {e}")
@@ -788,6 +1231,10 @@ class DatabaseManager:
         It tries PostgreSQL first, then MongoDB if PostgreSQL fails or returns no results.
         This is useful for retrieving historical data or analyzing block ranges.
         
+        Blocks returned by earlier calls are kept in memory, so when ranges overlap
+        only the part of the range that isn't cached is read from the database.
+        Use iter_blocks_in_range to stream large ranges without holding them in memory.
+        
         Args:
             start_block: Starting block number (inclusive)
             end_block: Ending block number (inclusive)
@@ -797,69 +1244,173 @@ class DatabaseManager:
             
         Note: Blocks are returned in ascending order by block number
         """
-        blocks = []
+        cached_blocks = {}
+        query_start, query_end = start_block, end_block
         
-        # ===== TRY POSTGRESQL FIRST =====
+        # Look the blocks up in memory first (ranges larger than the cache skip this)
+        if end_block - start_block < BLOCK_CACHE_SIZE:
+            missing = []
+            for block_number in range(start_block, end_block + 1):
+                cached_block = self._block_cache.get((block_number, None))
+                if cached_block is None:
+                    missing.append(block_number)
+                else:
+                    cached_blocks[block_number] = cached_block
+            
+            if not missing:
+                return [dict(cached_blocks[block_number]) for block_number in range(start_block, end_block + 1)]
+            
+            # Only query the span between the first and last block that isn't cached
+            query_start, query_end = missing[0], missing[-1]
+        
+        # Cache the blocks as they are read and merge them with the ones already in memory
+        for block in self.iter_blocks_in_range(query_start, query_end):
+            self._block_cache.set((block['block_number'], None), block)
+            cached_blocks[block['block_number']] = block
+        
+        return [dict(cached_blocks[block_number]) for block_number in sorted(cached_blocks)]
+    
+    def iter_blocks_in_range(self, start_block: int, end_block: int) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the blocks within a specified range from the database
+        
+        Rows are fetched from the server BLOCK_STREAM_BATCH_SIZE at a time and
+        yielded one by one, so memory use stays bounded however large the range
+        is. Tries PostgreSQL first, then MongoDB if PostgreSQL fails before
+        returning a block or has none in the range. Results are not cached.
+        
+        Args:
+            start_block: Starting block number (inclusive)
+            end_block: Ending block number (inclusive)
+            
+        Yields:
+            Dict[str, Any]: Block data dictionaries in ascending block number order
+        """
+        found_blocks = False
+        
+        # ===== TRY POSTGRESQL FIRST =====
         if self.use_postgres:
             try:
-                # Create a new database session
-                session = self.PostgresSession()
-                
-                # Query for blocks in the specified range
-                db_blocks = session.query(Block).filter(
-                    Block.block_number >= start_block,
-                    Block.block_number <= end_block
-                ).all()
-                session.close()
-                
-                # Convert SQLAlchemy objects to dictionaries
-                for block in db_blocks:
-                    blocks.append({
-                        'block_number': block.block_number,
-                        'block_hash': block.block_hash,
-                        'parent_hash': block.parent_hash,
-                        'timestamp': block.timestamp,
-                        'miner': block.miner,
-                        'difficulty': block.difficulty,
-                        'gas_limit': block.gas_limit,
-                        'gas_used': block.gas_used,
-                        'transaction_count': block.transaction_count
-                    })
+                with self.PostgresSession() as session:
+                    # Query for blocks in the specified range (streamed through a server-side cursor)
+                    db_blocks = session.execute(
+                        BLOCK_RANGE_SELECT, {'start_block': start_block, 'end_block': end_block},
+                        execution_options={'yield_per': BLOCK_STREAM_BATCH_SIZE}
+                    ).mappings()
+                    
+                    for block in db_blocks:
+                        found_blocks = True
+                        yield dict(block)
                     
             except Exception as e:
                 logger.error(f"Error retrieving blocks from PostgreSQL: {e}")
         
         # ===== TRY MONGODB IF POSTGRESQL FAILED OR RETURNED NO RESULTS =====
-        if not blocks and self.use_mongodb:
+        if not found_blocks and self.use_mongodb:
             try:
                 # Query MongoDB for blocks in the specified range
                 # $gte = greater than or equal, $lte = less than or equal
-                cursor = self.blocks_collection.find({
-                    'block_number': {'$gte': start_block, '$lte': end_block}
-                }).sort('block_number', 1)  # Sort by block number ascending
+                cursor = self.blocks_collection.find(
+                    {'block_number': {'$gte': start_block, '$lte': end_block}},
+                    {'_id': 0}  # Leave out the MongoDB-specific field
+                ).sort('block_number', 1).batch_size(BLOCK_STREAM_BATCH_SIZE)  # Sort by block number ascending
                 
-                # Convert MongoDB documents to dictionaries
-                for block in cursor:
-                    block.pop('_id', None)  # Remove MongoDB-specific field
-                    blocks.append(block)
+                yield from cursor
                     
             except Exception as e:
                 logger.error(f"Error retrieving blocks from MongoDB: {e}")
+    
+    def get_blocks_with_transactions(self, block_numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Retrieve several blocks together with their transactions in a fixed number of queries
+        
+        Fetching each block with get_block() costs one or two round trips per block.
+        This method loads all requested blocks with a single IN query and all their
+        transactions with a second one, then groups the transactions by block on the
+        client side.
+        
+        Args:
+            block_numbers: Block numbers to retrieve
+            
+        Returns:
+            Dict[int, Dict[str, Any]]: Block data keyed by block number, each with a
+            'transactions' list ordered by transaction index. Blocks that are not in the
+            database are missing from the result.
+        """
+        if not block_numbers:
+            return {}
+        
+        blocks = {}
+        
+        # ===== TRY POSTGRESQL FIRST =====
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    db_blocks = conn.execute(
+                        select(*BLOCK_COLUMNS).where(Block.block_number.in_(block_numbers))
+                    ).mappings()
+                    for block in db_blocks:
+                        block_data = dict(block)
+                        block_data['transactions'] = []
+                        blocks[block_data['block_number']] = block_data
+                    
+                    if blocks:
+                        transactions = conn.execute(
+                            select(*TRANSACTION_COLUMNS)
+                            .where(Transaction.block_number.in_(list(blocks)))
+                            .order_by(Transaction.block_number, Transaction.transaction_index)
+                        ).mappings()
+                        
+                        for tx in transactions:
+                            tx_data = dict(tx)
+                            tx_data['value_wei'] = str(tx_data['value_wei'])
+                            tx_data['value_ether'] = float(tx_data['value_ether'])
+                            tx_data['gas_price'] = str(tx_data['gas_price'])
+                            tx_data['gas_price_gwei'] = float(tx_data['gas_price_gwei'])
+                            blocks[tx_data['block_number']]['transactions'].append(tx_data)
+                
+            except Exception as e:
+                logger.error(f"Error retrieving blocks with transactions from PostgreSQL: {e}")
+                blocks = {}
+        
+        # ===== TRY MONGODB IF POSTGRESQL FAILED OR RETURNED NO RESULTS =====
+        if not blocks and self.use_mongodb:
+            try:
+                # The embedded transactions array is replaced below, so don't fetch it
+                for block in self.blocks_collection.find(
+                    {'block_number': {'$in': block_numbers}}, {'_id': 0, 'created_at': 0, 'transactions': 0}
+                ):
+                    block['transactions'] = []
+                    blocks[block['block_number']] = block
+                
+                if blocks:
+                    cursor = self.transactions_collection.find(
+                        {'block_number': {'$in': list(blocks)}}, {'_id': 0, 'created_at': 0}
+                    ).sort([('block_number', 1), ('transaction_index', 1)])
+                    
+                    for tx in cursor:
+                        blocks[tx['block_number']]['transactions'].append(tx)
+                    
+            except Exception as e:
+                logger.error(f"Error retrieving blocks with transactions from MongoDB: {e}")
         
         return blocks
     
-    def get_total_blocks_count(self) -> int:
+    def get_total_blocks_count(self, estimate: bool = False) -> int:
         """
         Get total number of blocks in the database
         
+        Args:
+            estimate: Allow an approximate count for large tables (e.g. for dashboard metrics)
+            
         Returns:
             int: Total number of blocks stored
         """
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                count = session.query(Block).count()
-                session.close()
+                # A single read query needs no ORM session, only a pooled connection
+                with self.postgres_engine.connect() as conn:
+                    count = self._count_rows(conn, Block, estimate)
                 return count
             except Exception as e:
                 logger.error(f"Error getting block count from PostgreSQL: {e}")
@@ -867,25 +1418,56 @@ class DatabaseManager:
         
         if self.use_mongodb:
             try:
-                return self.blocks_collection.count_documents({})
+                # Read the count from collection metadata instead of scanning every document
+                return self.blocks_collection.estimated_document_count()
             except Exception as e:
                 logger.error(f"Error getting block count from MongoDB: {e}")
                 return 0
         
         return 0
     
-    def get_total_transactions_count(self) -> int:
+    def count_transactions_in_block(self, block_number: int) -> int:
+        """
+        Count the transactions stored for a block
+        
+        Args:
+            block_number: The block number to count transactions for
+            
+        Returns:
+            int: Number of stored transactions for the block
+        """
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    count = conn.execute(
+                        select(func.count()).select_from(Transaction).where(Transaction.block_number == block_number)
+                    ).scalar()
+                return count
+            except Exception as e:
+                logger.error(f"Error counting transactions for block {block_number} in PostgreSQL: {e}")
+        
+        if self.use_mongodb:
+            try:
+                return self.transactions_collection.count_documents({'block_number': block_number})
+            except Exception as e:
+                logger.error(f"Error counting transactions for block {block_number} in MongoDB: {e}")
+        
+        return 0
+    
+    def get_total_transactions_count(self, estimate: bool = False) -> int:
         """
         Get total number of transactions in the database
         
+        Args:
+            estimate: Allow an approximate count for large tables (e.g. for dashboard metrics)
+            
         Returns:
             int: Total number of transactions stored
         """
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                count = session.query(Transaction).count()
-                session.close()
+                with self.postgres_engine.connect() as conn:
+                    count = self._count_rows(conn, Transaction, estimate)
                 return count
             except Exception as e:
                 logger.error(f"Error getting transaction count from PostgreSQL: {e}")
@@ -893,13 +1475,43 @@ class DatabaseManager:
         
         if self.use_mongodb:
             try:
-                return self.transactions_collection.count_documents({})
+                # Read the count from collection metadata instead of scanning every document
+                return self.transactions_collection.estimated_document_count()
             except Exception as e:
                 logger.error(f"Error getting transaction count from MongoDB: {e}")
                 return 0
         
         return 0
     
+    @staticmethod
+    def _count_rows(conn, model, estimate: bool) -> int:
+        """
+        Count the rows of a PostgreSQL table
+        
+        COUNT(*) has to scan the whole table. With estimate=True the planner's row
+        estimate from pg_class (kept up to date by autovacuum) is returned instead,
+        but only for tables of at least ESTIMATED_COUNT_MIN_ROWS rows.
+        
+        Args:
+            conn: Open database connection
+            model: SQLAlchemy model of the table
+            estimate: Whether an approximate count is acceptable
+            
+        Returns:
+            int: Number of rows
+        """
+        if estimate:
+            estimated = conn.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {'table': model.__tablename__}
+            ).scalar()
+            # reltuples is -1 (or 0) until the table has been analyzed
+            if estimated is not None and estimated >= ESTIMATED_COUNT_MIN_ROWS:
+                return estimated
+        
+        # Plain SELECT count(*) FROM table, without the subquery Query.count() wraps around it
+        return conn.execute(select(func.count()).select_from(model)).scalar() or 0
+    
     def get_latest_block_from_db(self) -> Optional[Dict[str, Any]]:
         """
         Get the latest block from the database
@@ -907,94 +1519,82 @@ class DatabaseManager:
         Returns:
             Optional[Dict[str, Any]]: Latest block data or None if no blocks exist
         """
+        # The dashboard polls this constantly, while the latest block only changes every ~12s
+        cached_block = self._latest_block_cache.get('latest')
+        if cached_block is not None:
+            return dict(cached_block)
+        
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                block = session.query(Block).order_by(Block.block_number.desc()).first()
-                session.close()
+                with self.postgres_engine.connect() as conn:
+                    # Walks the primary key index backwards and stops at the first row
+                    block = conn.execute(LATEST_BLOCK_SELECT).mappings().first()
                 
                 if block:
-                    return {
-                        'block_number': block.block_number,
-                        'block_hash': block.block_hash,
-                        'parent_hash': block.parent_hash,
-                        'timestamp': block.timestamp,
-                        'miner': block.miner,
-                        'difficulty': block.difficulty,
-                        'gas_limit': block.gas_limit,
-                        'gas_used': block.gas_used,
-                        'transaction_count': block.transaction_count
-                    }
+                    block_data = dict(block)
+                    self._latest_block_cache.set('latest', block_data)
+                    return dict(block_data)
             except Exception as e:
                 logger.error(f"Error getting latest block from PostgreSQL: {e}")
         
         if self.use_mongodb:
             try:
+                # The embedded transactions array isn't part of the result, so don't fetch it
                 block = self.blocks_collection.find_one(
-                    sort=[('block_number', -1)]
+                    {}, {'_id': 0, 'transactions': 0}, sort=[('block_number', -1)]
                 )
                 if block:
-                    block.pop('_id', None)
-                    return block
+                    self._latest_block_cache.set('latest', block)
+                    return dict(block)
             except Exception as e:
                 logger.error(f"Error getting latest block from MongoDB: {e}")
         
         return None
     
-    def get_recent_blocks(self, limit: int = 50, include_transactions: bool = True) -> List[Dict[str, Any]]:
+    def get_recent_blocks(self, limit: int = 50, include_transactions: bool = True,
+                          fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get recent blocks from the database
         
         Args:
             limit: Maximum number of blocks to return
             include_transactions: Whether to include transaction data
+            fields: Only load these block fields (transactions are then never included)
             
         Returns:
             List[Dict[str, Any]]: List of recent block data
         """
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                blocks = session.query(Block).order_by(Block.block_number.desc()).limit(limit).all()
-                
-                result_blocks = []
-                for block in blocks:
-                    block_data = {
-                        'block_number': block.block_number,
-                        'block_hash': block.block_hash,
-                        'parent_hash': block.parent_hash,
-                        'timestamp': block.timestamp,
-                        'miner': block.miner,
-                        'difficulty': block.difficulty,
-                        'gas_limit': block.gas_limit,
-                        'gas_used': block.gas_used,
-                        'transaction_count': block.transaction_count
-                    }
+                with self.postgres_engine.connect() as conn:
+                    if fields:
+                        # Select only the requested columns
+                        rows = conn.execute(
+                            select(*[getattr(Block, field) for field in fields])
+                            .order_by(Block.block_number.desc()).limit(limit)
+                        ).mappings().all()
+                        return [dict(row) for row in rows]
                     
-                    # Include transactions if requested
-                    if include_transactions:
-                        transactions = session.query(Transaction).filter(
-                            Transaction.block_number == block.block_number
-                        ).order_by(Transaction.transaction_index).all()
-                        
-                        block_data['transactions'] = [{
-                            'tx_hash': tx.tx_hash,
-                            'block_number': tx.block_number,
-                            'from_address': tx.from_address,
-                            'to_address': tx.to_address,
-                            'value_wei': tx.value_wei,
-                            'value_ether': tx.value_ether,
-                            'gas': tx.gas,
-                            'gas_price': tx.gas_price,
-                            'gas_price_gwei': tx.gas_price_gwei,
-                            'input_data': tx.input_data,
-                            'nonce': tx.nonce,
-                            'transaction_index': tx.transaction_index
-                        } for tx in transactions]
+                    blocks = conn.execute(
+                        select(*BLOCK_COLUMNS).order_by(Block.block_number.desc()).limit(limit)
+                    ).mappings().all()
+                    result_blocks = [dict(block) for block in blocks]
                     
-                    result_blocks.append(block_data)
-                
-                session.close()
+                    # Include transactions if requested, loading them for all blocks in one query
+                    if include_transactions and result_blocks:
+                        by_number = {}
+                        for block_data in result_blocks:
+                            block_data['transactions'] = []
+                            by_number[block_data['block_number']] = block_data
+                        
+                        transactions = conn.execute(
+                            select(*TRANSACTION_COLUMNS)
+                            .where(Transaction.block_number.in_(list(by_number)))
+                            .order_by(Transaction.block_number, Transaction.transaction_index)
+                        ).mappings().all()
+                        
+                        for tx in transactions:
+                            by_number[tx['block_number']]['transactions'].append(dict(tx))
                 return result_blocks
                 
             except Exception as e:
@@ -1003,31 +1603,29 @@ class DatabaseManager:
         
         if self.use_mongodb:
             try:
+                if fields:
+                    # Let the server drop every field that was not requested
+                    projection = dict.fromkeys(fields, 1)
+                    projection['_id'] = 0
+                    return list(self.blocks_collection.find(
+                        {}, projection, sort=[('block_number', -1)]
+                    ).limit(limit))
+                
+                # The embedded transactions array is replaced or dropped below, so don't fetch it;
+                # MongoDB-specific fields (_id, created_at) are left out by the server
                 blocks = list(self.blocks_collection.find(
-                    sort=[('block_number', -1)]
+                    {}, MONGO_BLOCK_PROJECTION, sort=[('block_number', -1)]
                 ).limit(limit))
                 
-                # Remove MongoDB-specific fields and handle transactions
                 for block in blocks:
-                    block.pop('_id', None)
-                    block.pop('created_at', None)
-                    
                     # Include transactions if requested
                     if include_transactions:
                         # Get transactions from the transactions collection
                         transactions = list(self.transactions_collection.find(
-                            {'block_number': block['block_number']}
+                            {'block_number': block['block_number']}, MONGO_TRANSACTION_PROJECTION
                         ).sort('transaction_index', 1))
                         
-                        # Remove MongoDB-specific fields from transactions
-                        for tx in transactions:
-                            tx.pop('_id', None)
-                            tx.pop('created_at', None)
-                        
                         block['transactions'] = transactions
-                    else:
-                        # Remove transactions if not requested
-                        block.pop('transactions', None)
                 
                 return blocks
             except Exception as e:
@@ -1036,96 +1634,870 @@ class DatabaseManager:
         
         return []
     
-    def get_recent_transactions(self, limit: int = 1000) -> List[Dict[str, Any]]:
+    def get_blocks_page(self, before_block_number: Optional[int] = None,
+                        limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get one page of blocks, newest first, using keyset pagination
+        
+        Pages are addressed by the last block number already seen rather than an
+        offset, so every page is a single index range scan of `limit` rows no
+        matter how deep it is.
+        
+        Args:
+            before_block_number: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of blocks per page
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[int]]: The blocks (without transactions)
+            and the cursor for the next page, or None when there are no more blocks
+        """
+        blocks = []
+        
+        if self.use_postgres:
+            try:
+                query = select(*BLOCK_COLUMNS).order_by(Block.block_number.desc()).limit(limit)
+                if before_block_number is not None:
+                    query = query.where(Block.block_number < before_block_number)
+                
+                with self.postgres_engine.connect() as conn:
+                    blocks = [dict(block) for block in conn.execute(query).mappings()]
+            except Exception as e:
+                logger.error(f"Error getting blocks page from PostgreSQL: {e}")
+        
+        if not blocks and self.use_mongodb:
+            try:
+                query = {} if before_block_number is None else {'block_number': {'$lt': before_block_number}}
+                blocks = list(self.blocks_collection.find(
+                    query, MONGO_BLOCK_PROJECTION, sort=[('block_number', -1)]
+                ).limit(limit))
+            except Exception as e:
+                logger.error(f"Error getting blocks page from MongoDB: {e}")
+                return [], None
+        
+        # A short page means the oldest block has been reached
+        next_cursor = blocks[-1]['block_number'] if blocks and len(blocks) == limit else None
+        return blocks, next_cursor
+    
+    def get_recent_transactions(self, limit: int = 1000, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get recent transactions from the database
         
         Args:
             limit: Maximum number of transactions to return
+            fields: Only load these transaction fields (defaults to all fields)
             
         Returns:
             List[Dict[str, Any]]: List of recent transaction data
         """
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                transactions = session.query(Transaction).order_by(Transaction.block_number.desc()).limit(limit).all()
-                session.close()
+                with self.postgres_engine.connect() as conn:
+                    if fields:
+                        # Select only the requested columns
+                        columns = [getattr(Transaction, field) for field in fields]
+                    else:
+                        columns = TRANSACTION_COLUMNS
+                    
+                    rows = conn.execute(
+                        select(*columns).order_by(Transaction.block_number.desc()).limit(limit)
+                    ).mappings().all()
                 
-                return [{
-                    'tx_hash': tx.tx_hash,
-                    'block_number': tx.block_number,
-                    'from_address': tx.from_address,
-                    'to_address': tx.to_address,
-                    'value_wei': tx.value_wei,
-                    'value_ether': tx.value_ether,
-                    'gas': tx.gas,
-                    'gas_price': tx.gas_price,
-                    'gas_price_gwei': tx.gas_price_gwei,
-                    'input_data': tx.input_data,
-                    'nonce': tx.nonce,
-                    'transaction_index': tx.transaction_index
-                } for tx in transactions]
+                return [dict(row) for row in rows]
             except Exception as e:
                 logger.error(f"Error getting recent transactions from PostgreSQL: {e}")
                 return []
         
         if self.use_mongodb:
             try:
-                transactions = list(self.transactions_collection.find(
-                    sort=[('block_number', -1)]
+                if fields:
+                    # Let the server drop every field that was not requested
+                    projection = dict.fromkeys(fields, 1)
+                    projection['_id'] = 0
+                    return list(self.transactions_collection.find(
+                        {}, projection, sort=[('block_number', -1)]
+                    ).limit(limit))
+                
+                return list(self.transactions_collection.find(
+                    {}, {'_id': 0}, sort=[('block_number', -1)]
                 ).limit(limit))
+            except Exception as e:
+                logger.error(f"Error getting recent transactions from MongoDB: {e}")
+                return []
+        
+        return []
+    
+    def count_recent_token_transfers(self, limit: int = 100) -> Dict[str, int]:
+        """
+        Count the likely ERC-20 token transfers among the most recent transactions
+        
+        Args:
+            limit: Number of most recent transactions to look at
+            
+        Returns:
+            Dict[str, int]: 'transaction_count' (transactions looked at) and
+            'token_transfer_count' (those calling transfer or transferFrom)
+        """
+        if self.use_postgres:
+            try:
+                recent = select(
+                    TRANSACTION_INPUT_SIGNATURE.label('signature')
+                ).order_by(Transaction.block_number.desc()).limit(limit).subquery()
+                with self.postgres_engine.connect() as conn:
+                    row = conn.execute(select(
+                        func.count().label('transaction_count'),
+                        func.count(case((recent.c.signature.in_(TOKEN_TRANSFER_SIGNATURES), 1))).label('token_transfer_count')
+                    ).select_from(recent)).one()
                 
-                # Remove MongoDB-specific fields
-                for tx in transactions:
-                    tx.pop('_id', None)
+                return {'transaction_count': row.transaction_count, 'token_transfer_count': row.token_transfer_count}
+            except Exception as e:
+                logger.error(f"Error counting recent token transfers in PostgreSQL: {e}")
+                return {'transaction_count': 0, 'token_transfer_count': 0}
+        
+        if self.use_mongodb:
+            try:
+                rows = list(self.transactions_collection.aggregate([
+                    {'$sort': {'block_number': -1}},
+                    {'$limit': limit},
+                    {'$group': {
+                        '_id': None,
+                        'transaction_count': {'$sum': 1},
+                        'token_transfer_count': {'$sum': {'$cond': [
+                            {'$in': [{'$substrCP': [MONGO_INPUT_DATA_TEXT, 0, 10]},
+                                     list(TOKEN_TRANSFER_SIGNATURES)]},
+                            1, 0
+                        ]}}
+                    }}
+                ]))
                 
-                return transactions
+                if not rows:
+                    return {'transaction_count': 0, 'token_transfer_count': 0}
+                return {'transaction_count': rows[0]['transaction_count'],
+                        'token_transfer_count': rows[0]['token_transfer_count']}
             except Exception as e:
-                logger.error(f"Error getting recent transactions from MongoDB: {e}")
+                logger.error(f"Error counting recent token transfers in MongoDB: {e}")
+                return {'transaction_count': 0, 'token_transfer_count': 0}
+        
+        return {'transaction_count': 0, 'token_transfer_count': 0}
+    
+    def count_recent_contract_activity(self, limit: int = 100) -> Dict[str, int]:
+        """
+        Count the contract calls and contract creations among the most recent transactions
+        
+        Args:
+            limit: Number of most recent transactions to look at
+            
+        Returns:
+            Dict[str, int]: 'transaction_count' (transactions looked at), 'contract_call_count'
+            (input data sent to an address) and 'contract_creation_count' (input data, no recipient)
+        """
+        empty = {'transaction_count': 0, 'contract_call_count': 0, 'contract_creation_count': 0}
+        
+        if self.use_postgres:
+            try:
+                recent = select(
+                    Transaction.input_data, Transaction.to_address
+                ).order_by(Transaction.block_number.desc()).limit(limit).subquery()
+                has_input = recent.c.input_data.notin_(EMPTY_INPUT_DATA)
+                has_to = recent.c.to_address != ''
+                with self.postgres_engine.connect() as conn:
+                    row = conn.execute(select(
+                        func.count().label('transaction_count'),
+                        func.count(case((and_(has_input, has_to), 1))).label('contract_call_count'),
+                        func.count(case((and_(has_input, func.coalesce(recent.c.to_address, '') == ''), 1))).label('contract_creation_count')
+                    ).select_from(recent)).one()
+                
+                return {'transaction_count': row.transaction_count,
+                        'contract_call_count': row.contract_call_count,
+                        'contract_creation_count': row.contract_creation_count}
+            except Exception as e:
+                logger.error(f"Error counting recent contract activity in PostgreSQL: {e}")
+                return empty
+        
+        if self.use_mongodb:
+            try:
+                has_input = {'$not': [{'$in': [{'$ifNull': ['$input_data', '']}, MONGO_EMPTY_INPUT_DATA]}]}
+                has_to = {'$ne': [{'$ifNull': ['$to_address', '']}, '']}
+                rows = list(self.transactions_collection.aggregate([
+                    {'$sort': {'block_number': -1}},
+                    {'$limit': limit},
+                    {'$group': {
+                        '_id': None,
+                        'transaction_count': {'$sum': 1},
+                        'contract_call_count': {'$sum': {'$cond': [{'$and': [has_input, has_to]}, 1, 0]}},
+                        'contract_creation_count': {'$sum': {'$cond': [{'$and': [has_input, {'$not': [has_to]}]}, 1, 0]}}
+                    }}
+                ]))
+                
+                if not rows:
+                    return empty
+                return {key: rows[0][key] for key in empty}
+            except Exception as e:
+                logger.error(f"Error counting recent contract activity in MongoDB: {e}")
+                return empty
+        
+        return empty
+    
+    def get_top_function_signatures(self, limit_rows: int = 100, top_n: int = 10) -> List[Tuple[str, int]]:
+        """
+        Get the most called function signatures among the most recent transactions
+        
+        Args:
+            limit_rows: Number of most recent transactions to look at
+            top_n: Maximum number of signatures to return
+            
+        Returns:
+            List[Tuple[str, int]]: (4-byte signature, call count) pairs, most called first
+        """
+        if self.use_postgres:
+            try:
+                recent = select(
+                    Transaction.input_data
+                ).order_by(Transaction.block_number.desc()).limit(limit_rows).subquery()
+                signature = func.substr(recent.c.input_data, 1, 10).label('signature')
+                with self.postgres_engine.connect() as conn:
+                    rows = conn.execute(select(
+                        signature, func.count().label('call_count')
+                    ).where(
+                        # Only '0x' text has a selector; rows still holding '\x...' are skipped
+                        recent.c.input_data.like('0x%'), func.length(recent.c.input_data) >= 10
+                    ).group_by(signature).order_by(func.count().desc(), signature).limit(top_n)).all()
+                
+                return [(row.signature, row.call_count) for row in rows]
+            except Exception as e:
+                logger.error(f"Error getting top function signatures from PostgreSQL: {e}")
+                return []
+        
+        if self.use_mongodb:
+            try:
+                rows = self.transactions_collection.aggregate([
+                    {'$sort': {'block_number': -1}},
+                    {'$limit': limit_rows},
+                    {'$match': {'$expr': {'$gte': [{'$strLenCP': MONGO_INPUT_DATA_TEXT}, 10]}}},
+                    {'$group': {'_id': {'$substrCP': [MONGO_INPUT_DATA_TEXT, 0, 10]}, 'call_count': {'$sum': 1}}},
+                    {'$sort': {'call_count': -1, '_id': 1}},
+                    {'$limit': top_n}
+                ])
+                return [(row['_id'], row['call_count']) for row in rows]
+            except Exception as e:
+                logger.error(f"Error getting top function signatures from MongoDB: {e}")
+                return []
+        
+        return []
+    
+    def get_recent_token_transfers(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the most recent transactions that are likely ERC-20 token transfers
+        
+        Args:
+            limit: Maximum number of transactions to return
+            
+        Returns:
+            List[Dict[str, Any]]: Transactions calling transfer or transferFrom, newest block first
+        """
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    rows = conn.execute(
+                        select(*TRANSACTION_COLUMNS)
+                        .where(TRANSACTION_INPUT_SIGNATURE.in_(TOKEN_TRANSFER_SIGNATURES))
+                        .order_by(Transaction.block_number.desc()).limit(limit)
+                    ).mappings().all()
+                
+                return [dict(row) for row in rows]
+            except Exception as e:
+                logger.error(f"Error getting recent token transfers from PostgreSQL: {e}")
+                return []
+        
+        if self.use_mongodb:
+            try:
+                # An anchored regex only has to look at the start of the input data
+                signature_pattern = '^(' + '|'.join(TOKEN_TRANSFER_SIGNATURES) + ')'
+                return list(self.transactions_collection.find(
+                    {'input_data': {'$regex': signature_pattern}}, {'_id': 0, 'created_at': 0},
+                    sort=[('block_number', -1)]
+                ).limit(limit))
+            except Exception as e:
+                logger.error(f"Error getting recent token transfers from MongoDB: {e}")
                 return []
         
         return []
     
+    def get_recent_blocks_frame(self, fields: List[str], limit: int = 50) -> pd.DataFrame:
+        """
+        Get selected fields of recent blocks as a DataFrame
+        
+        The query rows are transposed into typed columns, without first building
+        a list of dictionaries as get_recent_blocks does.
+        
+        Args:
+            fields: Block fields to load (become the DataFrame columns)
+            limit: Maximum number of blocks to return
+            
+        Returns:
+            pd.DataFrame: One row per block, newest first (empty if no blocks exist)
+        """
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    rows = conn.execute(select(*[getattr(Block, field) for field in fields]).order_by(
+                        Block.block_number.desc()
+                    ).limit(limit)).all()
+                return self._build_frame(rows, fields, BLOCK_DTYPES)
+            except Exception as e:
+                logger.error(f"Error getting recent blocks from PostgreSQL: {e}")
+                return pd.DataFrame(columns=fields)
+        
+        if self.use_mongodb:
+            try:
+                cursor = self.raw_blocks_collection.find(
+                    {}, {**dict.fromkeys(fields, 1), '_id': 0},
+                    sort=[('block_number', -1)], limit=limit, batch_size=MONGO_CURSOR_BATCH_SIZE
+                )
+                return self._build_frame(
+                    (tuple(doc.get(field) for field in fields) for doc in cursor), fields, BLOCK_DTYPES
+                )
+            except Exception as e:
+                logger.error(f"Error getting recent blocks from MongoDB: {e}")
+                return pd.DataFrame(columns=fields)
+        
+        return pd.DataFrame(columns=fields)
+    
+    def get_recent_transactions_frame(self, fields: List[str], limit: int = 1000) -> pd.DataFrame:
+        """
+        Get selected fields of recent transactions as a DataFrame
+        
+        The query rows are transposed into typed columns, without first building
+        a list of dictionaries as get_recent_transactions does.
+        
+        Args:
+            fields: Transaction fields to load (become the DataFrame columns)
+            limit: Maximum number of transactions to return
+            
+        Returns:
+            pd.DataFrame: One row per transaction, newest block first (empty if none exist)
+        """
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    rows = conn.execute(select(*[getattr(Transaction, field) for field in fields]).order_by(
+                        Transaction.block_number.desc()
+                    ).limit(limit)).all()
+                return self._build_frame(rows, fields, TRANSACTION_DTYPES)
+            except Exception as e:
+                logger.error(f"Error getting recent transactions from PostgreSQL: {e}")
+                return pd.DataFrame(columns=fields)
+        
+        if self.use_mongodb:
+            try:
+                cursor = self.raw_transactions_collection.find(
+                    {}, {**dict.fromkeys(fields, 1), '_id': 0},
+                    sort=[('block_number', -1)], limit=limit, batch_size=MONGO_CURSOR_BATCH_SIZE
+                )
+                return self._build_frame(
+                    (tuple(doc.get(field) for field in fields) for doc in cursor), fields, TRANSACTION_DTYPES
+                )
+            except Exception as e:
+                logger.error(f"Error getting recent transactions from MongoDB: {e}")
+                return pd.DataFrame(columns=fields)
+        
+        return pd.DataFrame(columns=fields)
+    
+    @staticmethod
+    def _build_frame(rows, fields: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from query result rows
+        
+        Each column is created once with its final dtype, instead of building an
+        object-typed frame row by row and casting it afterwards.
+        
+        Args:
+            rows: Iterable of tuples with one value per field
+            fields: Column names, in row order
+            dtypes: Mapping of column name to pandas dtype (other columns are inferred)
+            
+        Returns:
+            pd.DataFrame: The DataFrame with typed columns
+        """
+        columns = list(zip(*rows)) or [()] * len(fields)
+        return pd.DataFrame({
+            field: pd.Series(column, dtype=dtypes.get(field))
+            for field, column in zip(fields, columns)
+        })
+    
     def get_all_blocks(self) -> List[Dict[str, Any]]:
         """
         Get all blocks from the database
         
+        This materializes every stored block; use iter_all_blocks to stream them
+        instead.
+        
         Returns:
             List[Dict[str, Any]]: List of all block data
         """
+        return list(self.iter_all_blocks())
+    
+    def iter_all_blocks(self, batch_size: int = BLOCK_STREAM_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all blocks from the database
+        
+        Rows are fetched from the server batch_size at a time and yielded one by
+        one, so memory use stays bounded however many blocks are stored.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Dict[str, Any]: Block data dictionaries in ascending block number order
+        """
+        if self.use_postgres:
+            try:
+                with self.PostgresSession() as session:
+                    # Streamed through a server-side cursor
+                    blocks = session.execute(
+                        select(*BLOCK_COLUMNS)
+                        .order_by(Block.block_number.asc())
+                        .execution_options(yield_per=batch_size)
+                    ).mappings()
+                    
+                    for block in blocks:
+                        yield dict(block)
+            except Exception as e:
+                logger.error(f"Error getting all blocks from PostgreSQL: {e}")
+            return
+        
+        if self.use_mongodb:
+            try:
+                yield from self.blocks_collection.find({}, {'_id': 0}).sort('block_number', 1).batch_size(batch_size)
+            except Exception as e:
+                logger.error(f"Error getting all blocks from MongoDB: {e}")
+    
+    def normalize_input_data(self) -> int:
+        """
+        Convert transaction input data stored as raw bytes to '0x...' hex text
+        
+        Earlier versions stored web3's HexBytes as-is, which PostgreSQL saved as
+        '\\x...' text and MongoDB as BinData, so selector filters such as the token
+        transfer queries never matched those rows. Run this once after upgrading
+        (python main.py normalize-input); rows that are already text are left alone.
+        
+        Returns:
+            int: Number of rows/documents converted across all enabled databases
+        """
+        converted = 0
+        
+        # ===== UPDATE POSTGRESQL =====
         if self.use_postgres:
             try:
-                session = self.PostgresSession()
-                blocks = session.query(Block).order_by(Block.block_number.asc()).all()
-                session.close()
+                with self.postgres_engine.begin() as conn:
+                    result = conn.execute(
+                        update(Transaction)
+                        .where(func.left(Transaction.input_data, 2) == '\\x')
+                        .values(input_data=func.concat('0x', func.substr(Transaction.input_data, 3)))
+                    )
+                converted += result.rowcount
+                logger.info(f"Normalized input data of {result.rowcount} transactions in PostgreSQL")
+            except Exception as e:
+                logger.error(f"Error normalizing input data in PostgreSQL: {e}")
+        
+        # ===== UPDATE MONGODB =====
+        if self.use_mongodb:
+            try:
+                cursor = self.transactions_collection.find(
+                    {'input_data': {'$type': 'binData'}}, {'input_data': 1}
+                ).batch_size(INPUT_DATA_NORMALIZE_BATCH_SIZE)
                 
+                mongo_converted = 0
+                updates = []
+                for doc in cursor:
+                    updates.append(UpdateOne({'_id': doc['_id']}, {'$set': {'input_data': _hex_text(doc['input_data'])}}))
+                    if len(updates) >= INPUT_DATA_NORMALIZE_BATCH_SIZE:
+                        mongo_converted += self.transactions_collection.bulk_write(updates, ordered=False).modified_count
+                        updates = []
+                if updates:
+                    mongo_converted += self.transactions_collection.bulk_write(updates, ordered=False).modified_count
+                
+                converted += mongo_converted
+                logger.info(f"Normalized input data of {mongo_converted} transactions in MongoDB")
+            except Exception as e:
+                logger.error(f"Error normalizing input data in MongoDB: {e}")
+        
+        # Cached blocks and transactions may hold the old values
+        self._block_cache.clear()
+        self._tx_cache.clear()
+        return converted
+    
+    def update_daily_stats(self, since_timestamp: Optional[int] = None) -> bool:
+        """
+        Materialize per-day block statistics into the daily_stats table/collection
+        
+        Days are recomputed from the stored blocks and upserted, so the call is
+        idempotent. Pass the timestamp of the oldest newly stored block to only
+        refresh the days it could have changed.
+        
+        Args:
+            since_timestamp: Only recompute days from the UTC day containing this
+                Unix timestamp onwards (None recomputes every day)
+            
+        Returns:
+            bool: True if all enabled databases were updated
+        """
+        success = True
+        # Recompute whole days, starting at midnight UTC of the first affected day
+        day_start = since_timestamp - since_timestamp % 86400 if since_timestamp is not None else None
+        
+        # ===== UPDATE POSTGRESQL =====
+        if self.use_postgres:
+            try:
+                with self.PostgresSession() as session:
+                    day = _utc_day(Block.timestamp)
+                    daily = session.query(
+                        day,
+                        func.count(),
+                        func.sum(Block.transaction_count),
+                        func.sum(Block.gas_used),
+                        func.max(Block.gas_used),
+                        func.sum(Block.gas_limit)
+                    ).group_by(day)
+                    if day_start is not None:
+                        daily = daily.filter(Block.timestamp >= day_start)
+                    
+                    # INSERT ... SELECT ... ON CONFLICT (date) DO UPDATE
+                    stmt = pg_insert(DailyStats).from_select(
+                        ['date', 'block_count', 'transaction_count', 'total_gas_used', 'max_gas_used', 'total_gas_limit'],
+                        daily.statement
+                    )
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[DailyStats.date],
+                        set_={column: stmt.excluded[column] for column in
+                              ['block_count', 'transaction_count', 'total_gas_used', 'max_gas_used', 'total_gas_limit']}
+                    )
+                    session.execute(stmt)
+                    session.commit()
+            except Exception as e:
+                logger.error(f"Error updating daily stats in PostgreSQL: {e}")
+                success = False
+        
+        # ===== UPDATE MONGODB =====
+        if self.use_mongodb:
+            try:
+                pipeline = [
+                    {'$group': {
+                        '_id': MONGO_UTC_DAY,
+                        'block_count': {'$sum': 1},
+                        'transaction_count': {'$sum': '$transaction_count'},
+                        'total_gas_used': {'$sum': '$gas_used'},
+                        'max_gas_used': {'$max': '$gas_used'},
+                        'total_gas_limit': {'$sum': '$gas_limit'}
+                    }},
+                    {'$merge': {'into': 'daily_stats', 'whenMatched': 'replace', 'whenNotMatched': 'insert'}}
+                ]
+                if day_start is not None:
+                    pipeline.insert(0, {'$match': {'timestamp': {'$gte': day_start}}})
+                self.blocks_collection.aggregate(pipeline)
+            except Exception as e:
+                logger.error(f"Error updating daily stats in MongoDB: {e}")
+                success = False
+        
+        return success
+    
+    def _catch_up_daily_stats(self):
+        """
+        Bring the materialized daily statistics up to date with the stored blocks
+        
+        The ETL pipeline refreshes daily_stats after every batch, but the table can
+        be empty or start later than the blocks (a database filled before it existed)
+        or miss the newest days (blocks stored directly with store_block_with_transactions).
+        The first and last stored blocks are compared with the first and last
+        materialized days, and only the missing days are recomputed. To recompute
+        every day manually, call update_daily_stats() (python main.py refresh-stats).
+        """
+        checks = []
+        
+        if self.use_postgres:
+            try:
+                with self.postgres_engine.connect() as conn:
+                    # Block timestamps grow with the block number, so the primary key finds both ends
+                    first_timestamp = conn.execute(
+                        select(Block.timestamp).order_by(Block.block_number.asc()).limit(1)
+                    ).scalar()
+                    last_timestamp = conn.execute(
+                        select(Block.timestamp).order_by(Block.block_number.desc()).limit(1)
+                    ).scalar()
+                    first_day, last_day = conn.execute(select(func.min(DailyStats.date), func.max(DailyStats.date))).one()
+                checks.append(self._daily_stats_gap(first_timestamp, last_timestamp, first_day, last_day))
+            except Exception as e:
+                logger.error(f"Error checking daily stats in PostgreSQL: {e}")
+        
+        if self.use_mongodb:
+            try:
+                first_block = self.blocks_collection.find_one({}, {'timestamp': 1}, sort=[('block_number', 1)])
+                last_block = self.blocks_collection.find_one({}, {'timestamp': 1}, sort=[('block_number', -1)])
+                first_stats = self.daily_stats_collection.find_one({}, {'_id': 1}, sort=[('_id', 1)])
+                last_stats = self.daily_stats_collection.find_one({}, {'_id': 1}, sort=[('_id', -1)])
+                checks.append(self._daily_stats_gap(
+                    first_block['timestamp'] if first_block else None,
+                    last_block['timestamp'] if last_block else None,
+                    first_stats['_id'] if first_stats else None,
+                    last_stats['_id'] if last_stats else None
+                ))
+            except Exception as e:
+                logger.error(f"Error checking daily stats in MongoDB: {e}")
+        
+        gaps = [since_timestamp for missing, since_timestamp in checks if missing]
+        if not gaps:
+            return
+        
+        # One refresh covers every enabled database; None (recompute everything) wins
+        since_timestamp = None if None in gaps else min(gaps)
+        logger.info(f"Materializing daily statistics for blocks stored since "
+                    f"{'the first block' if since_timestamp is None else datetime.utcfromtimestamp(since_timestamp).date()}")
+        self.update_daily_stats(since_timestamp=since_timestamp)
+    
+    @staticmethod
+    def _daily_stats_gap(first_timestamp: Optional[int], last_timestamp: Optional[int],
+                         first_day: Optional[str], last_day: Optional[str]) -> Tuple[bool, Optional[int]]:
+        """
+        Work out which days of daily statistics are missing
+        
+        Args:
+            first_timestamp: Timestamp of the first stored block (None if there are no blocks)
+            last_timestamp: Timestamp of the last stored block
+            first_day: First materialized day as YYYY-MM-DD (None if there are none)
+            last_day: Last materialized day as YYYY-MM-DD
+            
+        Returns:
+            Tuple[bool, Optional[int]]: Whether days are missing, and the since_timestamp to pass
+            to update_daily_stats (None to recompute every day)
+        """
+        if first_timestamp is None:
+            return False, None
+        
+        if first_day is None or first_day > datetime.utcfromtimestamp(first_timestamp).strftime('%Y-%m-%d'):
+            return True, None
+        
+        if last_day < datetime.utcfromtimestamp(last_timestamp).strftime('%Y-%m-%d'):
+            # The last materialized day may only be partly counted, so recompute it too
+            return True, calendar.timegm(datetime.strptime(last_day, '%Y-%m-%d').timetuple())
+        
+        return False, None
+    
+    def get_daily_transaction_counts(self) -> List[Dict[str, Any]]:
+        """
+        Get the number of transactions per day
+        
+        Reads the rows materialized by update_daily_stats (brought up to date with
+        the stored blocks when the manager starts). Until those exist the blocks are
+        aggregated directly.
+        
+        Returns:
+            List[Dict[str, Any]]: Rows with 'date' (YYYY-MM-DD, UTC) and 'transaction_count',
+            in ascending date order
+        """
+        if self.use_postgres:
+            try:
+                with self.PostgresSession() as session:
+                    rows = session.query(DailyStats.date, DailyStats.transaction_count).order_by(DailyStats.date).all()
+                    
+                    if not rows:
+                        day = _utc_day(Block.timestamp)
+                        rows = session.query(
+                            day.label('date'),
+                            func.sum(Block.transaction_count).label('transaction_count')
+                        ).group_by(day).order_by(day).all()
+                
+                return [{'date': row.date, 'transaction_count': int(row.transaction_count)} for row in rows]
+            except Exception as e:
+                logger.error(f"Error getting daily transaction counts from PostgreSQL: {e}")
+                return []
+        
+        if self.use_mongodb:
+            try:
+                rows = list(self.daily_stats_collection.find({}, {'transaction_count': 1}).sort('_id', 1))
+                
+                if not rows:
+                    rows = self.blocks_collection.aggregate([
+                        {'$group': {'_id': MONGO_UTC_DAY, 'transaction_count': {'$sum': '$transaction_count'}}},
+                        {'$sort': {'_id': 1}}
+                    ])
+                
+                return [{'date': row['_id'], 'transaction_count': row['transaction_count']} for row in rows]
+            except Exception as e:
+                logger.error(f"Error getting daily transaction counts from MongoDB: {e}")
+                return []
+        
+        return []
+    
+    def get_gas_statistics(self) -> Optional[Dict[str, float]]:
+        """
+        Get gas usage statistics over all stored blocks
+        
+        Combines the per-day totals materialized by update_daily_stats, falling
+        back to aggregating the blocks directly until those exist.
+        
+        Returns:
+            Optional[Dict[str, float]]: Dictionary with 'avg_gas_used', 'max_gas_used' and
+            'avg_gas_limit', or None if no blocks exist
+        """
+        if self.use_postgres:
+            try:
+                with self.PostgresSession() as session:
+                    total_blocks = func.sum(DailyStats.block_count)
+                    row = session.query(
+                        (func.sum(DailyStats.total_gas_used) / total_blocks).label('avg_gas_used'),
+                        func.max(DailyStats.max_gas_used).label('max_gas_used'),
+                        (func.sum(DailyStats.total_gas_limit) / total_blocks).label('avg_gas_limit')
+                    ).one()
+                    
+                    if row.max_gas_used is None:
+                        row = session.query(
+                            func.avg(Block.gas_used).label('avg_gas_used'),
+                            func.max(Block.gas_used).label('max_gas_used'),
+                            func.avg(Block.gas_limit).label('avg_gas_limit')
+                        ).one()
+                
+                if row.max_gas_used is None:
+                    return None
+                return {
+                    'avg_gas_used': float(row.avg_gas_used),
+                    'max_gas_used': float(row.max_gas_used),
+                    'avg_gas_limit': float(row.avg_gas_limit)
+                }
+            except Exception as e:
+                logger.error(f"Error getting gas statistics from PostgreSQL: {e}")
+                return None
+        
+        if self.use_mongodb:
+            try:
+                rows = list(self.daily_stats_collection.aggregate([
+                    {'$group': {
+                        '_id': None,
+                        'block_count': {'$sum': '$block_count'},
+                        'total_gas_used': {'$sum': '$total_gas_used'},
+                        'max_gas_used': {'$max': '$max_gas_used'},
+                        'total_gas_limit': {'$sum': '$total_gas_limit'}
+                    }},
+                    {'$project': {
+                        'avg_gas_used': {'$divide': ['$total_gas_used', '$block_count']},
+                        'max_gas_used': 1,
+                        'avg_gas_limit': {'$divide': ['$total_gas_limit', '$block_count']}
+                    }}
+                ]))
+                
+                if not rows:
+                    rows = list(self.blocks_collection.aggregate([
+                        {'$group': {
+                            '_id': None,
+                            'avg_gas_used': {'$avg': '$gas_used'},
+                            'max_gas_used': {'$max': '$gas_used'},
+                            'avg_gas_limit': {'$avg': '$gas_limit'}
+                        }}
+                    ]))
+                
+                if not rows:
+                    return None
+                return {
+                    'avg_gas_used': float(rows[0]['avg_gas_used']),
+                    'max_gas_used': float(rows[0]['max_gas_used']),
+                    'avg_gas_limit': float(rows[0]['avg_gas_limit'])
+                }
+            except Exception as e:
+                logger.error(f"Error getting gas statistics from MongoDB: {e}")
+                return None
+        
+        return None
+    
+    def get_block_time_histogram(self, bins: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get a histogram of the time between consecutive blocks, computed by the database
+        
+        Block times are the differences between adjacent block timestamps, split
+        into equal-width bins between the smallest and largest block time.
+        
+        Args:
+            bins: Number of histogram bins
+            
+        Returns:
+            List[Dict[str, Any]]: Non-empty bins with 'bin_start', 'bin_end' (seconds) and
+            'count', in ascending order
+        """
+        if self.use_postgres:
+            try:
+                with self.PostgresSession() as session:
+                    # Difference to the previous block's timestamp, computed with a window function.
+                    # As a CTE it is evaluated once and shared by the bounds and the binning below,
+                    # so the whole histogram is a single query and a single scan.
+                    block_times = session.query(
+                        (Block.timestamp - func.lag(Block.timestamp).over(order_by=Block.timestamp)).label('block_time')
+                    ).cte('block_times')
+                    block_time = block_times.c.block_time
+                    bounds = session.query(
+                        func.min(block_time).label('low'),
+                        func.max(block_time).label('high')
+                    ).cte('bounds')
+                    
+                    width = case(
+                        (bounds.c.high > bounds.c.low, cast(bounds.c.high - bounds.c.low, Float) / bins),
+                        else_=1.0
+                    )
+                    bucket = func.least(func.floor((block_time - bounds.c.low) / width), bins - 1)
+                    rows = session.query(
+                        bucket.label('bucket'),
+                        func.count().label('count'),
+                        bounds.c.low,
+                        bounds.c.high
+                    ).select_from(block_times).join(bounds, true()).filter(
+                        block_time.isnot(None)
+                    ).group_by(bucket, bounds.c.low, bounds.c.high).order_by(bucket).all()
+                
+                if not rows:
+                    return []
+                
+                low, high = rows[0].low, rows[0].high
+                width = (high - low) / bins if high > low else 1
                 return [{
-                    'block_number': block.block_number,
-                    'block_hash': block.block_hash,
-                    'parent_hash': block.parent_hash,
-                    'timestamp': block.timestamp,
-                    'miner': block.miner,
-                    'difficulty': block.difficulty,
-                    'gas_limit': block.gas_limit,
-                    'gas_used': block.gas_used,
-                    'transaction_count': block.transaction_count
-                } for block in blocks]
+                    'bin_start': low + int(row.bucket) * width,
+                    'bin_end': low + (int(row.bucket) + 1) * width,
+                    'count': row.count
+                } for row in rows]
             except Exception as e:
-                logger.error(f"Error getting all blocks from PostgreSQL: {e}")
+                logger.error(f"Error getting block time histogram from PostgreSQL: {e}")
                 return []
         
         if self.use_mongodb:
             try:
-                blocks = list(self.blocks_collection.find().sort('block_number', 1))
+                # Difference to the previous block's timestamp, computed with a window stage
+                block_time_stages = [
+                    {'$setWindowFields': {
+                        'sortBy': {'timestamp': 1},
+                        'output': {'previous_timestamp': {'$shift': {'output': '$timestamp', 'by': -1}}}
+                    }},
+                    {'$match': {'previous_timestamp': {'$ne': None}}},
+                    {'$project': {'block_time': {'$subtract': ['$timestamp', '$previous_timestamp']}}}
+                ]
                 
-                # Remove MongoDB-specific fields
-                for block in blocks:
-                    block.pop('_id', None)
+                bounds = list(self.blocks_collection.aggregate(block_time_stages + [
+                    {'$group': {'_id': None, 'low': {'$min': '$block_time'}, 'high': {'$max': '$block_time'}}}
+                ]))
+                if not bounds:
+                    return []
+                low, high = bounds[0]['low'], bounds[0]['high']
                 
-                return blocks
+                width = (high - low) / bins if high > low else 1
+                rows = self.blocks_collection.aggregate(block_time_stages + [
+                    {'$group': {
+                        '_id': {'$min': [{'$floor': {'$divide': [{'$subtract': ['$block_time', low]}, width]}}, bins - 1]},
+                        'count': {'$sum': 1}
+                    }},
+                    {'$sort': {'_id': 1}}
+                ])
+                
+                return [{
+                    'bin_start': low + int(row['_id']) * width,
+                    'bin_end': low + (int(row['_id']) + 1) * width,
+                    'count': row['count']
+                } for row in rows]
             except Exception as e:
-                logger.error(f"Error getting all blocks from MongoDB: {e}")
+                logger.error(f"Error getting block time histogram from MongoDB: {e}")
                 return []
         
         return []
@@ -1137,6 +2509,10 @@ class DatabaseManager:
         This method properly closes all database connections to prevent
         resource leaks and ensure clean shutdown of the application.
         """
+        # Wait for any write still running on the I/O thread pool
+        if hasattr(self, '_io_pool'):
+            self._io_pool.shutdown(wait=True)
+        
         # Close PostgreSQL engine (this closes all connections in the pool)
         if hasattr(self, 'postgres_engine'):
             self.postgres_engine.dispose()
@@ -1148,7 +2524,62 @@ class DatabaseManager:
         logger.info("Database connections closed")
 
 
+class BlockWriteBuffer:
+    """
+    Collects blocks and stores them with DatabaseManager.store_blocks_with_transactions
+    
+    Blocks are written once max_blocks of them have been added or max_seconds
+    have passed since the last write, so syncing many blocks costs one commit
+    per batch instead of one per block. Call flush() once done adding blocks
+    to write whatever is still buffered.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, max_blocks: int = DB_WRITE_BATCH_BLOCKS,
+                 max_seconds: float = DB_WRITE_BATCH_SECONDS):
+        """
+        Initialize an empty buffer
+        
+        Args:
+            db_manager: Database manager the blocks are stored with
+            max_blocks: Number of buffered blocks that triggers a write
+            max_seconds: Seconds since the last write that trigger a write
+        """
+        self.db_manager = db_manager
+        self.max_blocks = max_blocks
+        self.max_seconds = max_seconds
+        self._blocks = []
+        self._last_flush = time.monotonic()
+    
+    def add(self, block_data: Dict[str, Any]) -> int:
+        """
+        Buffer a block (with its 'transactions' list), writing the buffer if it is due
+        
+        Args:
+            block_data: Block dictionary to store
+            
+        Returns:
+            int: Number of blocks stored by this call (0 while the block stays buffered)
+        """
+        self._blocks.append(block_data)
+        
+        if len(self._blocks) >= self.max_blocks or time.monotonic() - self._last_flush >= self.max_seconds:
+            return self.flush()
+        return 0
+    
+    def flush(self) -> int:
+        """
+        Store every buffered block
+        
+        Returns:
+            int: Number of blocks stored successfully
+        """
+        blocks, self._blocks = self._blocks, []
+        self._last_flush = time.monotonic()
+        return self.db_manager.store_blocks_with_transactions(blocks)
+
+
 # ===== EXAMPLE USAGE AND TESTING =====
+
 if __name__ == "__main__":
     """
     Example usage and testing of the DatabaseManager class
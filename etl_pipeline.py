@@ -4,13 +4,15 @@ Extract, Transform, Load pipeline for blockchain data collection
 """
 
 import logging
+import threading
 import time
 import schedule
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from blockchain_client import BlockchainClient
-from database import DatabaseManager
-from config import BATCH_SIZE, START_BLOCK, END_BLOCK
+from database import BlockWriteBuffer, DatabaseManager
+from config import BATCH_SIZE, START_BLOCK, END_BLOCK, ETL_MAX_WORKERS
 
 # Set up logging
 logging.basicConfig(
@@ -40,6 +42,8 @@ class ETLPipeline:
         self.blockchain_client = BlockchainClient()
         self.db_manager = DatabaseManager(use_postgres=use_postgres, use_mongodb=use_mongodb)
         self.last_processed_block = self._get_last_processed_block()
+        # Concurrent historical batches must not refresh the daily statistics at the same time
+        self._daily_stats_lock = threading.Lock()
         
         logger.info(f"ETL Pipeline initialized. Last processed block: {self.last_processed_block}")
     
@@ -48,11 +52,10 @@ class ETLPipeline:
         try:
             # Try to get the highest block number from database
             if self.db_manager.use_postgres:
-                session = self.db_manager.PostgresSession()
-                result = session.query(self.db_manager.Block.block_number).order_by(
-                    self.db_manager.Block.block_number.desc()
-                ).first()
-                session.close()
+                with self.db_manager.PostgresSession() as session:
+                    result = session.query(self.db_manager.Block.block_number).order_by(
+                        self.db_manager.Block.block_number.desc()
+                    ).first()
                 if result:
                     return result[0]
             
@@ -81,22 +84,19 @@ class ETLPipeline:
         """
         logger.info(f"Extracting blocks from {start_block} to {end_block}")
         
-        blocks = []
-        for block_num in range(start_block, end_block + 1):
-            try:
-                block_data = self.blockchain_client.get_block(block_num, include_transactions=True)
-                if block_data:
-                    blocks.append(block_data)
-                    logger.info(f"Extracted block {block_num} with {len(block_data.get('transactions', []))} transactions")
-                else:
-                    logger.warning(f"Block {block_num} not found or failed to extract")
-                
-                # Rate limiting to avoid API limits
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Error extracting block {block_num}: {e}")
-                continue
+        try:
+            # Blocks are fetched in JSON-RPC batches by the blockchain client
+            blocks = self.blockchain_client.get_block_range(start_block, end_block)
+        except Exception as e:
+            logger.error(f"Error extracting blocks {start_block} to {end_block}: {e}")
+            return []
+        
+        for block_data in blocks:
+            logger.info(f"Extracted block {block_data['block_number']} with {len(block_data.get('transactions', []))} transactions")
+        
+        missing_blocks = (end_block - start_block + 1) - len(blocks)
+        if missing_blocks > 0:
+            logger.warning(f"{missing_blocks} block(s) between {start_block} and {end_block} not found or failed to extract")
         
         logger.info(f"Successfully extracted {len(blocks)} blocks")
         return blocks
@@ -168,15 +168,15 @@ class ETLPipeline:
         """
         logger.info(f"Loading {len(blocks)} blocks into database")
         
+        # Blocks are written in batches rather than with one commit each
+        write_buffer = BlockWriteBuffer(self.db_manager)
+        
         success_count = 0
         for block_data in blocks:
             try:
                 # Transform block data
                 transformed_block = self.transform_block_data(block_data)
                 
-                # Store block with transactions
-                logger.info(f"Storing block {block_data['block_number']} with {len(block_data.get('transactions', []))} transactions")
-                
                 # Ensure transactions are properly transformed
                 if 'transactions' in block_data and block_data['transactions']:
                     transformed_transactions = []
@@ -188,19 +188,38 @@ class ETLPipeline:
                     transformed_block['transactions'] = []
                     logger.warning(f"Block {block_data['block_number']} has no transactions to store")
                 
-                if self.db_manager.store_block_with_transactions(transformed_block):
-                    success_count += 1
-                    logger.info(f"Successfully loaded block {block_data['block_number']} with {len(transformed_block.get('transactions', []))} transactions")
-                else:
-                    logger.error(f"Failed to load block {block_data['block_number']}")
+                success_count += write_buffer.add(transformed_block)
                 
             except Exception as e:
                 logger.error(f"Error loading block {block_data.get('block_number', 'unknown')}: {e}")
                 continue
         
+        success_count += write_buffer.flush()
+        
         logger.info(f"Successfully loaded {success_count}/{len(blocks)} blocks")
         return success_count
     
+    def update_daily_stats(self, since_timestamp: Optional[int] = None) -> bool:
+        """
+        Recompute the per-day statistics read by the dashboard
+        
+        Args:
+            since_timestamp: Only refresh days from the one containing this Unix
+                timestamp onwards (None refreshes every day)
+            
+        Returns:
+            True if the statistics were updated
+        """
+        with self._daily_stats_lock:
+            updated = self.db_manager.update_daily_stats(since_timestamp=since_timestamp)
+        
+        if updated:
+            logger.info("Daily statistics updated")
+            return True
+        
+        logger.error("Failed to update daily statistics")
+        return False
+    
     def process_block_range(self, start_block: int, end_block: int) -> Dict[str, Any]:
         """
         Process a range of blocks (Extract, Transform, Load)
@@ -233,6 +252,10 @@ class ETLPipeline:
         # Load
         blocks_loaded = self.load_blocks(blocks)
         
+        # Refresh the materialized daily statistics for the days these blocks fall on
+        if blocks_loaded > 0:
+            self.update_daily_stats(since_timestamp=min(block['timestamp'] for block in blocks))
+        
         processing_time = time.time() - start_time
         
         stats = {
@@ -322,31 +345,34 @@ class ETLPipeline:
             'success': True
         }
         
-        current_block = start_block
+        start_time = time.time()
+        batches = [
+            (batch_start, min(batch_start + BATCH_SIZE - 1, end_block))
+            for batch_start in range(start_block, end_block + 1, BATCH_SIZE)
+        ]
         
-        while current_block <= end_block:
-            batch_end = min(current_block + BATCH_SIZE - 1, end_block)
-            
-            logger.info(f"Processing batch: {current_block} to {batch_end}")
-            
-            batch_stats = self.process_block_range(current_block, batch_end)
-            
-            total_stats['total_blocks_extracted'] += batch_stats['blocks_extracted']
-            total_stats['total_blocks_loaded'] += batch_stats['blocks_loaded']
-            total_stats['total_processing_time'] += batch_stats['processing_time']
-            total_stats['batches_processed'] += 1
-            
-            if not batch_stats['success']:
-                total_stats['success'] = False
-                logger.error(f"Batch processing failed for blocks {current_block} to {batch_end}")
-            
-            current_block = batch_end + 1
-            
-            # Update last processed block
-            self.last_processed_block = batch_end
-            
-            # Small delay between batches
-            time.sleep(1)
+        def process_batch(batch):
+            logger.info(f"Processing batch: {batch[0]} to {batch[1]}")
+            return self.process_block_range(*batch)
+        
+        # Batches are network-bound, so several run at once; the blockchain client's
+        # rate limiter keeps their combined RPC traffic within the provider quota
+        with ThreadPoolExecutor(max_workers=max(1, min(ETL_MAX_WORKERS, len(batches)))) as executor:
+            for (batch_start, batch_end), batch_stats in zip(batches, executor.map(process_batch, batches)):
+                total_stats['total_blocks_extracted'] += batch_stats['blocks_extracted']
+                total_stats['total_blocks_loaded'] += batch_stats['blocks_loaded']
+                total_stats['batches_processed'] += 1
+                
+                if not batch_stats['success']:
+                    total_stats['success'] = False
+                    logger.error(f"Batch processing failed for blocks {batch_start} to {batch_end}")
+        
+        # Batches overlap, so this is the wall time rather than the sum of batch times
+        total_stats['total_processing_time'] = time.time() - start_time
+        
+        # Update last processed block
+        if batches:
+            self.last_processed_block = end_block
         
         logger.info(f"Historical processing completed: {total_stats}")
         return total_stats
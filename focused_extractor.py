@@ -159,8 +159,8 @@ class FocusedDataExtractor:
                     token_transfer = {
                         'tx_hash': tx_hash,
                         'token_address': log['address'],
-                        'from_address': '0x' + log['topics'][1].hex()[-40:],  # Remove padding
-                        'to_address': '0x' + log['topics'][2].hex()[-40:],    # Remove padding
+                        'from_address': '0x' + bytes.hex(log['topics'][1])[-40:],  # Remove padding
+                        'to_address': '0x' + bytes.hex(log['topics'][2])[-40:],    # Remove padding
                         'value': int(log['data'], 16),  # Token amount
                         'log_index': log['logIndex'],
                         'block_number': log['blockNumber']
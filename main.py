@@ -7,6 +7,7 @@ It allows users to:
 1. Collect blockchain data (latest blocks, historical blocks, or scheduled collection)
 2. Run a Streamlit dashboard for data visualization
 3. Test the blockchain connection and database functionality
+4. Export block ranges to Parquet files
 
 The script uses argparse to handle different command-line arguments and subcommands.
 """
@@ -61,10 +62,19 @@ Examples:
 
   # Test the blockchain connection and database functionality
   python main.py test
+
+  # Export blocks 1000 to 1100 to blocks.parquet and transactions.parquet
+  python main.py export --start 1000 --end 1100 --output exports
+
+  # Convert input data stored as raw bytes by earlier versions to 0x hex text
+  python main.py normalize-input
+
+  # Recompute the daily statistics shown on the Network Statistics page
+  python main.py refresh-stats
         """
     )
     
-    # Create subparsers for different commands (collect, dashboard, test)
+    # Create subparsers for different commands (collect, dashboard, test, export, normalize-input, refresh-stats)
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # ===== COLLECT COMMAND =====
@@ -99,6 +109,34 @@ Examples:
     test_parser = subparsers.add_parser('test', 
                                        help='Test blockchain connection and database functionality')
     
+    # ===== EXPORT COMMAND =====
+    # This command writes a block range to columnar Parquet files without using a database
+    export_parser = subparsers.add_parser('export', help='Export a block range to Parquet files')
+    export_parser.add_argument('--start', type=int, required=True, 
+                              help='Starting block number to export')
+    export_parser.add_argument('--end', type=int, required=True, 
+                              help='Ending block number to export')
+    export_parser.add_argument('--output', default='.', 
+                              help='Directory for blocks.parquet and transactions.parquet')
+    
+    # ===== NORMALIZE-INPUT COMMAND =====
+    # This one-time maintenance command rewrites input data stored as raw bytes as 0x hex text
+    normalize_parser = subparsers.add_parser('normalize-input',
+                                            help='Convert stored transaction input data to 0x hex text')
+    normalize_parser.add_argument('--postgres', action='store_true', 
+                                 help='Only update PostgreSQL')
+    normalize_parser.add_argument('--mongodb', action='store_true', 
+                                 help='Only update MongoDB')
+    
+    # ===== REFRESH-STATS COMMAND =====
+    # This command recomputes the materialized per-day statistics from all stored blocks
+    refresh_parser = subparsers.add_parser('refresh-stats',
+                                          help='Recompute the daily statistics from the stored blocks')
+    refresh_parser.add_argument('--postgres', action='store_true', 
+                               help='Only update PostgreSQL')
+    refresh_parser.add_argument('--mongodb', action='store_true', 
+                               help='Only update MongoDB')
+    
     # Parse the command-line arguments
     args = parser.parse_args()
     
@@ -115,6 +153,12 @@ Examples:
             run_dashboard()       # Launch dashboard
         elif args.command == 'test':
             run_test()           # Run tests
+        elif args.command == 'export':
+            run_export(args)     # Export blocks to Parquet
+        elif args.command == 'normalize-input':
+            run_normalize_input(args)  # Convert stored input data to hex text
+        elif args.command == 'refresh-stats':
+            run_refresh_stats(args)    # Recompute daily statistics
     
     except KeyboardInterrupt:
         # Handle graceful shutdown when user presses Ctrl+C
@@ -323,6 +367,99 @@ def run_test():
         sys.exit(1)
 
 
+def run_export(args):
+    """
+    Export a block range to Parquet files
+    
+    Blocks are fetched BATCH_SIZE at a time as columnar Arrow tables and
+    appended to blocks.parquet and transactions.parquet in the output
+    directory, so memory use does not grow with the size of the range.
+    
+    Args:
+        args: Parsed command-line arguments with start, end and output
+    """
+    import os
+    import pyarrow.parquet as pq
+    from blockchain_client import BlockchainClient
+    
+    logger.info(f"Exporting blocks {args.start} to {args.end} to {args.output}")
+    
+    os.makedirs(args.output, exist_ok=True)
+    client = BlockchainClient()
+    block_writer = None
+    tx_writer = None
+    total_blocks = 0
+    total_transactions = 0
+    
+    try:
+        for batch_start in range(args.start, args.end + 1, BATCH_SIZE):
+            batch_end = min(batch_start + BATCH_SIZE - 1, args.end)
+            blocks_table, transactions_table = client.get_block_range_tables(batch_start, batch_end)
+            
+            # Writers are opened with the schema of the first batch
+            if block_writer is None:
+                block_writer = pq.ParquetWriter(os.path.join(args.output, 'blocks.parquet'), blocks_table.schema)
+                tx_writer = pq.ParquetWriter(os.path.join(args.output, 'transactions.parquet'), transactions_table.schema)
+            
+            block_writer.write_table(blocks_table)
+            tx_writer.write_table(transactions_table)
+            total_blocks += blocks_table.num_rows
+            total_transactions += transactions_table.num_rows
+            logger.info(f"Exported blocks {batch_start} to {batch_end}")
+    
+    finally:
+        if block_writer is not None:
+            block_writer.close()
+            tx_writer.close()
+    
+    print(f"✅ Exported {total_blocks:,} blocks and {total_transactions:,} transactions to {args.output}")
+
+
+def run_normalize_input(args):
+    """
+    Convert transaction input data stored as raw bytes to 0x hex text
+    
+    Args:
+        args: Parsed command-line arguments selecting the databases (both by default)
+    """
+    from database import DatabaseManager
+    
+    use_postgres = args.postgres or not args.mongodb
+    use_mongodb = args.mongodb or not args.postgres
+    
+    db_manager = DatabaseManager(use_postgres=use_postgres, use_mongodb=use_mongodb)
+    try:
+        converted = db_manager.normalize_input_data()
+    finally:
+        db_manager.close()
+    
+    print(f"✅ Converted input data of {converted:,} transactions to 0x hex text")
+
+
+def run_refresh_stats(args):
+    """
+    Recompute the daily statistics of every day from the stored blocks
+    
+    Args:
+        args: Parsed command-line arguments selecting the databases (both by default)
+    """
+    from database import DatabaseManager
+    
+    use_postgres = args.postgres or not args.mongodb
+    use_mongodb = args.mongodb or not args.postgres
+    
+    db_manager = DatabaseManager(use_postgres=use_postgres, use_mongodb=use_mongodb)
+    try:
+        updated = db_manager.update_daily_stats()
+    finally:
+        db_manager.close()
+    
+    if not updated:
+        print("❌ Failed to refresh daily statistics")
+        sys.exit(1)
+    print("✅ Daily statistics refreshed")
+
+
 def print_collection_stats(stats):
     """
     Display comprehensive collection statistics in a formatted table
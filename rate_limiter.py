@@ -0,0 +1,59 @@
+"""
+Rate Limiter Module
+Thread-safe token bucket used to keep RPC traffic within the provider's request quota
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    Tokens are added continuously at `rate` per second up to `capacity`. Each
+    request takes tokens from the bucket and waits only when the bucket is
+    empty, so short bursts run at full speed while the long-run rate stays at
+    or below `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket (starts full)
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        """
+        Take tokens from the bucket, blocking until enough are available
+
+        Args:
+            tokens: Number of tokens needed (e.g. the number of calls in a batch)
+        """
+        if self.rate <= 0:
+            return
+
+        # A request larger than the bucket could never be satisfied - cap it
+        tokens = min(tokens, self.capacity)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
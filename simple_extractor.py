@@ -159,8 +159,8 @@ class SimpleDataExtractor:
                         token_transfer = {
                             'tx_hash': tx_hash,
                             'token_address': log['address'],
-                            'from_address': '0x' + log['topics'][1].hex()[-40:],
-                            'to_address': '0x' + log['topics'][2].hex()[-40:],
+                            'from_address': '0x' + bytes.hex(log['topics'][1])[-40:],
+                            'to_address': '0x' + bytes.hex(log['topics'][2])[-40:],
                             'raw_data': log['data'].hex(),  # Store raw data instead of parsing
                             'log_index': log['logIndex'],
                             'block_number': log['blockNumber']